@@ -4,12 +4,16 @@
 
 from fastapi import APIRouter
 
+from app.api.admin.router import router as admin_router
 from app.api.auth.router import router as auth_router
 from app.api.products.router import router as products_router
 from app.api.utils.router import router as utils_router
+from app.api.well_known.router import router as well_known_router
 
 app_router = APIRouter()
 
 app_router.include_router(auth_router)
+app_router.include_router(admin_router)
 app_router.include_router(utils_router)
 app_router.include_router(products_router)
+app_router.include_router(well_known_router)
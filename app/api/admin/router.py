@@ -0,0 +1,97 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.mysql.session import get_mysql_db, get_mysql_read_db
+from app.database.postgresql.session import get_postgres_db, get_postgres_read_db
+from app.depends.jwt_depends import ClaimsPrincipal, get_admin_claims
+from app.depends.language_depends import get_language
+
+from .service import AdminService, resolve_format
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+# ======================================
+# LIST USERS (keyset pages) → PostgreSQL
+# ======================================
+@router.get("/users")
+async def list_users(
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=500),
+    role: str | None = Query(default=None),
+    is_active: bool | None = Query(default=None),
+    principal: ClaimsPrincipal = Depends(get_admin_claims),
+    db: AsyncSession = Depends(get_postgres_read_db),
+    lang: str = Depends(get_language),
+):
+    return await AdminService.list_users(db, cursor, limit, role, is_active, lang)
+
+
+# ======================================
+# EXPORT USERS (NDJSON stream) → PostgreSQL
+# ======================================
+@router.get("/users/export")
+async def export_users(
+    role: str | None = Query(default=None),
+    is_active: bool | None = Query(default=None),
+    principal: ClaimsPrincipal = Depends(get_admin_claims),
+):
+    return AdminService.export_users(role, is_active)
+
+
+# ======================================
+# LIST ADMINS (keyset pages) → MySQL
+# ======================================
+@router.get("/admins")
+async def list_admins(
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=500),
+    role: str | None = Query(default=None),
+    is_active: bool | None = Query(default=None),
+    principal: ClaimsPrincipal = Depends(get_admin_claims),
+    db: AsyncSession = Depends(get_mysql_read_db),
+    lang: str = Depends(get_language),
+):
+    return await AdminService.list_admins(db, cursor, limit, role, is_active, lang)
+
+
+# ======================================
+# EXPORT ADMINS (NDJSON stream) → MySQL
+# ======================================
+@router.get("/admins/export")
+async def export_admins(
+    role: str | None = Query(default=None),
+    is_active: bool | None = Query(default=None),
+    principal: ClaimsPrincipal = Depends(get_admin_claims),
+):
+    return AdminService.export_admins(role, is_active)
+
+
+# ======================================
+# IMPORT USERS (CSV / NDJSON) → PostgreSQL
+# ======================================
+@router.post("/import/users")
+async def import_users(
+    request: Request,
+    format: str | None = Query(default=None, pattern="^(csv|ndjson)$"),
+    principal: ClaimsPrincipal = Depends(get_admin_claims),
+    db: AsyncSession = Depends(get_postgres_db),
+    lang: str = Depends(get_language),
+):
+    fmt = resolve_format(request.headers.get("content-type"), format)
+    return await AdminService.import_users(request.stream(), fmt, db, lang)
+
+
+# ======================================
+# IMPORT ADMINS (CSV / NDJSON) → MySQL
+# ======================================
+@router.post("/import/admins")
+async def import_admins(
+    request: Request,
+    format: str | None = Query(default=None, pattern="^(csv|ndjson)$"),
+    principal: ClaimsPrincipal = Depends(get_admin_claims),
+    db: AsyncSession = Depends(get_mysql_db),
+    lang: str = Depends(get_language),
+):
+    fmt = resolve_format(request.headers.get("content-type"), format)
+    return await AdminService.import_admins(request.stream(), fmt, db, lang)
@@ -0,0 +1,46 @@
+from pydantic import EmailStr, Field
+
+from app.core.response.base_schema import CustomModel
+
+
+# =============================
+# IMPORT
+# =============================
+
+class ImportRow(CustomModel):
+    username: str = Field(min_length=1, max_length=100)
+    email: EmailStr
+    password: str = Field(min_length=1)
+    is_active: bool = True
+
+
+class ImportIssue(CustomModel):
+    line: int
+    username: str | None = Field(default=None)
+    reason: str
+
+
+class ImportSummary(CustomModel):
+    received: int = 0
+    created: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    issues: list[ImportIssue] = Field(default_factory=list)
+    issues_truncated: bool = False
+
+
+# =============================
+# LISTING
+# =============================
+
+class PrincipalItem(CustomModel):
+    id: int
+    username: str
+    email: str
+    role: str
+    is_active: bool | None = Field(default=None)
+
+
+class PrincipalPage(CustomModel):
+    items: list[PrincipalItem]
+    next_cursor: str | None = Field(default=None)
@@ -0,0 +1,339 @@
+import base64
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator
+
+from fastapi import status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.admin.schema import (
+    ImportIssue,
+    ImportRow,
+    ImportSummary,
+    PrincipalItem,
+    PrincipalPage,
+)
+from app.config import settings
+from app.core.error.error_types import ErrorType
+from app.core.error.message_codes import MessageCode
+from app.core.middleware.exception_middleware import AppException
+from app.core.response.response_builder import ResponseBuilder
+from app.core.security.username_filter import username_filter
+from app.database.mysql.session import get_ctx_mysql_read_db
+from app.database.postgresql.session import get_ctx_postgres_read_db
+from app.database.replicas import read_your_writes
+from app.models.mysql.admin import AdminBaseModel, TblAdmin
+from app.models.postgresql.users import TblUser, UsersBaseModel
+from app.utils.crypto_utils import hash_passwords_bulk
+
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+MAX_LINE_LENGTH = 64 * 1024
+
+
+# ======================================
+# STREAM PARSING
+# ======================================
+
+def resolve_format(content_type: str | None, requested: str | None) -> str:
+    """`?format=` wins over Content-Type; anything else is a 400."""
+
+    fmt = requested or IMPORT_CONTENT_TYPES.get(
+        (content_type or "").split(";")[0].strip().lower()
+    )
+    if fmt not in ("csv", "ndjson"):
+        raise _invalid_input()
+    return fmt
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, str]]:
+    """Split a UTF-8 byte stream into numbered lines without buffering the body."""
+
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    line_no = 0
+
+    try:
+        async for chunk in chunks:
+            buffer += decoder.decode(chunk)
+            *lines, buffer = buffer.split("\n")
+            if len(buffer) > MAX_LINE_LENGTH:
+                raise _invalid_input()
+            for line in lines:
+                line_no += 1
+                yield line_no, line.rstrip("\r")
+        buffer += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise _invalid_input()
+
+    if buffer:
+        yield line_no + 1, buffer.rstrip("\r")
+
+
+async def iter_records(
+    lines: AsyncIterator[tuple[int, str]], fmt: str
+) -> AsyncIterator[tuple[int, dict[str, Any] | None, str | None]]:
+    """
+    Yield (line, record, error) per non-blank line.
+
+    CSV needs a header row and one record per line (no quoted newlines);
+    empty cells count as missing. NDJSON lines must be JSON objects.
+    """
+
+    header: list[str] | None = None
+
+    async for line_no, line in lines:
+        if not line.strip():
+            continue
+
+        if fmt == "ndjson":
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield line_no, None, "invalid JSON"
+                continue
+            if isinstance(record, dict):
+                yield line_no, record, None
+            else:
+                yield line_no, None, "expected a JSON object"
+            continue
+
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield line_no, None, f"expected {len(header)} columns, got {len(values)}"
+            continue
+        yield line_no, {
+            name: value for name, value in zip(header, values) if value != ""
+        }, None
+
+
+# ======================================
+# OPAQUE CURSORS
+# ======================================
+
+def encode_cursor(last_id: int) -> str:
+    raw = json.dumps({"after": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        after = json.loads(raw)["after"]
+    except (ValueError, TypeError, KeyError):
+        raise _invalid_input()
+    if not isinstance(after, int) or isinstance(after, bool):
+        raise _invalid_input()
+    return after
+
+
+def _invalid_input() -> AppException:
+    return AppException(
+        ErrorType.VAL_400_INVALID_INPUT,
+        MessageCode.INVALID_INPUT,
+        status.HTTP_400_BAD_REQUEST,
+    )
+
+
+def _describe(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+class AdminService:
+    # ======================================
+    # LIST USERS / ADMINS (keyset pages)
+    # ======================================
+    @staticmethod
+    async def list_users(db: AsyncSession, cursor, limit, role, is_active, lang: str):
+        return await AdminService._list(TblUser, db, cursor, limit, role, is_active, lang)
+
+    @staticmethod
+    async def list_admins(db: AsyncSession, cursor, limit, role, is_active, lang: str):
+        return await AdminService._list(TblAdmin, db, cursor, limit, role, is_active, lang)
+
+    @staticmethod
+    async def _list(model, db, cursor, limit, role, is_active, lang):
+
+        # One extra row tells whether another page exists
+        rows = await model.list_page(
+            db, decode_cursor(cursor), limit + 1, role, is_active
+        )
+        items = [PrincipalItem.model_validate(row) for row in rows[:limit]]
+
+        return ResponseBuilder.build(
+            ErrorType.SUC_200_SUCCESS,
+            MessageCode.DATA_FETCHED,
+            lang,
+            data=PrincipalPage(
+                items=items,
+                next_cursor=encode_cursor(items[-1].id) if len(rows) > limit else None,
+            ),
+        )
+
+    # ======================================
+    # EXPORT USERS / ADMINS (NDJSON stream)
+    # ======================================
+    @staticmethod
+    def export_users(role, is_active) -> StreamingResponse:
+        return AdminService._export(TblUser, get_ctx_postgres_read_db, role, is_active)
+
+    @staticmethod
+    def export_admins(role, is_active) -> StreamingResponse:
+        return AdminService._export(TblAdmin, get_ctx_mysql_read_db, role, is_active)
+
+    @staticmethod
+    def _export(model, session_factory, role, is_active) -> StreamingResponse:
+        """
+        Stream every matching row as NDJSON in constant memory.
+
+        The body opens its own session: request-scoped dependencies are
+        already closed by the time the response is being sent.
+        """
+
+        async def body():
+            async with session_factory() as db:
+                async for partition in model.stream_listing(db, role, is_active):
+                    yield "".join(
+                        json.dumps(dict(row), separators=(",", ":")) + "\n"
+                        for row in partition
+                    )
+
+        return StreamingResponse(body(), media_type="application/x-ndjson")
+
+    # ======================================
+    # IMPORT USERS → PostgreSQL (COPY)
+    # ======================================
+    @staticmethod
+    async def import_users(
+        chunks: AsyncIterator[bytes], fmt: str, db: AsyncSession, lang: str
+    ):
+        return await AdminService._import(
+            "user", TblUser, UsersBaseModel, "1", chunks, fmt, db, lang
+        )
+
+    # ======================================
+    # IMPORT ADMINS → MySQL (multi-row INSERT)
+    # ======================================
+    @staticmethod
+    async def import_admins(
+        chunks: AsyncIterator[bytes], fmt: str, db: AsyncSession, lang: str
+    ):
+        return await AdminService._import(
+            "admin", TblAdmin, AdminBaseModel, "admin", chunks, fmt, db, lang
+        )
+
+    # ======================================
+    # IMPORT (shared)
+    # ======================================
+    @staticmethod
+    async def _import(realm, model, base_model, role, chunks, fmt, db, lang):
+        """
+        Validate the stream row by row and write it in committed batches.
+
+        Nothing is looked up before inserting: rows that clash with an
+        existing username/email are skipped by the insert itself and
+        reported as duplicates. Batches already written stay committed if
+        a later part of the stream is rejected.
+        """
+
+        summary = ImportSummary()
+        batch: list[tuple[int, ImportRow]] = []
+
+        async for line_no, record, error in iter_records(iter_lines(chunks), fmt):
+            summary.received += 1
+
+            if error is None:
+                try:
+                    batch.append((line_no, ImportRow.model_validate(record)))
+                except ValidationError as exc:
+                    error = _describe(exc)
+
+            if error is not None:
+                username = (record or {}).get("username")
+                AdminService._report(
+                    summary, "invalid", line_no,
+                    username if isinstance(username, str) else None, error,
+                )
+                continue
+
+            if len(batch) >= settings.IMPORT_BATCH_SIZE:
+                await AdminService._write_batch(
+                    realm, model, base_model, role, batch, db, summary
+                )
+                batch = []
+
+        if batch:
+            await AdminService._write_batch(
+                realm, model, base_model, role, batch, db, summary
+            )
+
+        return ResponseBuilder.build(
+            ErrorType.SUC_201_RESOURCE_CREATED,
+            MessageCode.RESOURCE_CREATED,
+            lang,
+            data=summary,
+        )
+
+    @staticmethod
+    async def _write_batch(realm, model, base_model, role, batch, db, summary):
+
+        # First occurrence wins; repeats within a batch are duplicates too
+        unique: dict[str, tuple[int, ImportRow]] = {}
+        for line_no, row in batch:
+            if row.username in unique:
+                AdminService._report(
+                    summary, "duplicates", line_no, row.username, "duplicate"
+                )
+            else:
+                unique[row.username] = (line_no, row)
+
+        rows = list(unique.values())
+        hashes = await hash_passwords_bulk([row.password for _, row in rows])
+
+        created = await model.bulk_create(db, [
+            base_model(
+                username=row.username,
+                email=row.email,
+                role=role,
+                hashed_password=hashed_password,
+                is_active=row.is_active,
+            )
+            for (_, row), hashed_password in zip(rows, hashes)
+        ])
+        await db.commit()
+        await username_filter.add(realm, *created)
+        await read_your_writes.mark(realm, *created.values())
+
+        summary.created += len(created)
+        for line_no, row in rows:
+            if row.username not in created:
+                AdminService._report(
+                    summary, "duplicates", line_no, row.username, "duplicate"
+                )
+
+    @staticmethod
+    def _report(summary: ImportSummary, kind: str, line: int, username, reason: str):
+
+        setattr(summary, kind, getattr(summary, kind) + 1)
+        if len(summary.issues) < settings.IMPORT_MAX_REPORTED_ROWS:
+            summary.issues.append(
+                ImportIssue(line=line, username=username, reason=reason)
+            )
+        else:
+            summary.issues_truncated = True
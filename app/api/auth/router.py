@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
+from app.core.security.login_throttle import login_throttle
 from app.database.mysql.session import get_mysql_db
 
 from app.database.postgresql.session import get_postgres_db
-from app.depends.jwt_depends import get_current_admin, get_current_user
+from app.depends.jwt_depends import (
+    ClaimsPrincipal,
+    get_current_admin,
+    get_current_claims,
+    get_current_user,
+)
 from app.depends.language_depends import get_language
 
 from .service import AuthService
@@ -13,6 +18,7 @@ from .schema import (
     UserRegisterRequest,
     AdminRegisterRequest,
     LoginRequest,
+    RefreshTokenRequest,
 )
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -36,7 +42,7 @@ async def register_user(
 @router.post("/admin/register")
 async def register_admin(
     data: AdminRegisterRequest,
-    db: Session = Depends(get_mysql_db),
+    db: AsyncSession = Depends(get_mysql_db),
     lang: str = Depends(get_language),
 ):
     return await AuthService.register_admin(data, db, lang)
@@ -48,10 +54,12 @@ async def register_admin(
 @router.post("/user/login")
 async def user_login(
     data: LoginRequest,
+    request: Request,
     db: AsyncSession = Depends(get_postgres_db),
     lang: str = Depends(get_language),
 ):
-    return await AuthService.user_login(data, db, lang)
+    client_ip = login_throttle.client_ip(request)
+    return await AuthService.user_login(data, db, lang, client_ip)
 
 
 # ======================================
@@ -60,10 +68,67 @@ async def user_login(
 @router.post("/admin/login")
 async def admin_login(
     data: LoginRequest,
-    db: Session = Depends(get_mysql_db),
+    request: Request,
+    db: AsyncSession = Depends(get_mysql_db),
+    lang: str = Depends(get_language),
+):
+    client_ip = login_throttle.client_ip(request)
+    return await AuthService.admin_login(data, db, lang, client_ip)
+
+
+# ======================================
+# USER TOKEN REFRESH
+# ======================================
+@router.post("/user/refresh")
+async def user_refresh(
+    data: RefreshTokenRequest,
+    lang: str = Depends(get_language),
+):
+    return await AuthService.user_refresh(data, lang)
+
+
+# ======================================
+# ADMIN TOKEN REFRESH
+# ======================================
+@router.post("/admin/refresh")
+async def admin_refresh(
+    data: RefreshTokenRequest,
+    lang: str = Depends(get_language),
+):
+    return await AuthService.admin_refresh(data, lang)
+
+
+# ======================================
+# LOGOUT (current session)
+# ======================================
+@router.post("/logout")
+async def logout(
+    principal: ClaimsPrincipal = Depends(get_current_claims),
+    lang: str = Depends(get_language),
+):
+    return await AuthService.logout(principal, lang)
+
+
+# ======================================
+# LOGOUT (every session)
+# ======================================
+@router.post("/logout-all")
+async def logout_all(
+    principal: ClaimsPrincipal = Depends(get_current_claims),
+    lang: str = Depends(get_language),
+):
+    return await AuthService.logout_all(principal, lang)
+
+
+# ======================================
+# ACTIVE SESSIONS
+# ======================================
+@router.get("/sessions")
+async def list_sessions(
+    principal: ClaimsPrincipal = Depends(get_current_claims),
     lang: str = Depends(get_language),
 ):
-    return await AuthService.admin_login(data, db, lang)
+    return await AuthService.list_sessions(principal, lang)
 
 
 # ======================================
@@ -28,6 +28,14 @@ class LoginRequest(CustomModel):
     password: str
 
 
+# =============================
+# REFRESH
+# =============================
+
+class RefreshTokenRequest(CustomModel):
+    refresh_token: str
+
+
 # =============================
 # TOKEN RESPONSE
 # =============================
@@ -47,4 +55,18 @@ class ProfileResponse(CustomModel):
     id: int | None =Field(default=None)
     username: str | None =Field(default=None)
     email: str | None =Field(default=None)
-    role: str | None =Field(default=None)
\ No newline at end of file
+    role: str | None =Field(default=None)
+
+
+# =============================
+# SESSIONS
+# =============================
+
+class SessionResponse(CustomModel):
+
+    session_id: str
+    access_jti: str | None = Field(default=None)
+    access_expires_at: int | None = Field(default=None)
+    refresh_jti: str | None = Field(default=None)
+    refresh_expires_at: int | None = Field(default=None)
+    current: bool = False
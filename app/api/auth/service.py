@@ -1,21 +1,37 @@
+import math
+
+from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
 from app.api.auth.schema import (
     AdminRegisterRequest,
     ProfileResponse,
+    RefreshTokenRequest,
+    SessionResponse,
     TokenData,
     UserRegisterRequest,
 )
+from app.core.cache.principal_cache import principal_cache
 from app.core.error.error_types import ErrorType
 from app.core.error.message_codes import MessageCode
+from app.core.middleware.exception_middleware import AppException
 from app.core.response.response_builder import ResponseBuilder
-from app.depends.jwt_depends import jwt_service
+from app.core.security.login_throttle import login_throttle
+from app.core.security.username_filter import username_filter
+from app.database.mysql.session import get_ctx_mysql_db
+from app.database.postgresql.session import get_session_maker
+from app.database.replicas import read_your_writes
+from app.depends.jwt_depends import ClaimsPrincipal, jwt_service
 from app.models.mysql.admin import AdminBaseModel as MyUserBase
 from app.models.mysql.admin import TblAdmin
 from app.models.postgresql.users import TblUser
 from app.models.postgresql.users import UsersBaseModel as PgUserBase
-from app.utils.crypto_utils import hash_password, verify_password
+from app.utils.crypto_utils import (
+    dummy_verify_async,
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
 
 
 class AuthService:
@@ -25,23 +41,24 @@ class AuthService:
     @staticmethod
     async def register_user(data: UserRegisterRequest, db: AsyncSession, lang: str):
 
-        existing = await TblUser.get_by_username(db, data.username)
-        if existing:
-            return ResponseBuilder.build(
-                ErrorType.VAL_400_VALIDATION_ERROR,
-                MessageCode.USERNAME_EXISTS,
-                lang,
-            )
-
         user_data = PgUserBase(
             username=data.username,
             email=data.email,
-            hashed_password=hash_password(data.password),
+            hashed_password=await hash_password_async(data.password),
             role="1",
         )
 
-        await TblUser.create(db, user_data)
+        # The insert itself reports a taken username/email (no pre-check)
+        created = await TblUser.insert_if_absent(db, user_data)
+        if created is None:
+            return ResponseBuilder.build(
+                ErrorType.VAL_400_VALIDATION_ERROR,
+                MessageCode.USERNAME_EXISTS,
+                lang,
+            )
         await db.commit()
+        await username_filter.add("user", data.username)
+        await read_your_writes.mark("user", created["id"])
         return ResponseBuilder.build(
             ErrorType.SUC_201_RESOURCE_CREATED,
             MessageCode.RESOURCE_CREATED,
@@ -52,25 +69,26 @@ class AuthService:
     # ADMIN REGISTER → MySQL
     # ======================================
     @staticmethod
-    async def register_admin(data: AdminRegisterRequest, db: Session, lang: str):
-
-        existing = await TblAdmin.get_by_username(db, data.username)
-        if existing:
-            return ResponseBuilder.build(
-                ErrorType.CON_409_CONFLICT_ERROR,
-                MessageCode.USERNAME_EXISTS,
-                lang,
-            )
+    async def register_admin(data: AdminRegisterRequest, db: AsyncSession, lang: str):
 
         admin_data = MyUserBase(
             username=data.username,
             email=data.email,
             role="admin",
-            hashed_password=hash_password(data.password),
+            hashed_password=await hash_password_async(data.password),
         )
 
-        await TblAdmin.create(db, admin_data)
-        db.commit()
+        # The insert itself reports a taken username/email (no pre-check)
+        created = await TblAdmin.insert_if_absent(db, admin_data)
+        if created is None:
+            return ResponseBuilder.build(
+                ErrorType.CON_409_CONFLICT_ERROR,
+                MessageCode.USERNAME_EXISTS,
+                lang,
+            )
+        await db.commit()
+        await username_filter.add("admin", data.username)
+        await read_your_writes.mark("admin", created["id"])
 
         return ResponseBuilder.build(
             ErrorType.SUC_201_RESOURCE_CREATED,
@@ -82,21 +100,30 @@ class AuthService:
     # USER LOGIN (Postgres)
     # ======================================
     @staticmethod
-    async def user_login(data, db: AsyncSession, lang: str):
+    async def user_login(data, db: AsyncSession, lang: str, client_ip: str = "unknown"):
 
-        user = await TblUser.get_by_username(db, data.username)
+        retry_after = await login_throttle.hit("user", data.username, client_ip)
+        if retry_after:
+            return AuthService._throttled(lang, retry_after)
 
-        if not user or not verify_password(data.password, user.hashed_password):
-            return ResponseBuilder.build(
-                ErrorType.AUTH_401_INVALID_CREDENTIALS,
-                MessageCode.INVALID_CREDENTIALS,
-                lang,
-            )
+        user = None
+        if await username_filter.might_exist("user", data.username):
+            user = await TblUser.get_by_username(db, data.username)
 
-        access_token = await jwt_service.create_access_token(
-            user_id=user.id, role=user.role
-        )
-        refresh_token = await jwt_service.create_refresh_token(
+        # Unknown usernames still pay for one verification (uniform timing)
+        if user is None:
+            await dummy_verify_async(data.password)
+            return AuthService._invalid_credentials(lang)
+
+        if not await verify_password_async(data.password, user.hashed_password):
+            return AuthService._invalid_credentials(lang)
+
+        if needs_rehash(user.hashed_password):
+            if await AuthService._rehash(TblUser, PgUserBase, db, user.id, data.password):
+                await db.commit()
+                await AuthService._principal_changed("user", user.id)
+
+        access_token, refresh_token = await jwt_service.issue_token_pair(
             user_id=user.id, role=user.role
         )
 
@@ -113,21 +140,30 @@ class AuthService:
     # ADMIN LOGIN (MySQL)
     # ======================================
     @staticmethod
-    async def admin_login(data, db: Session, lang: str):
+    async def admin_login(data, db: AsyncSession, lang: str, client_ip: str = "unknown"):
 
-        admin = await TblAdmin.get_by_username(db, data.username)
+        retry_after = await login_throttle.hit("admin", data.username, client_ip)
+        if retry_after:
+            return AuthService._throttled(lang, retry_after)
 
-        if not admin or not verify_password(data.password, admin.hashed_password):
-            return ResponseBuilder.build(
-                ErrorType.AUTH_401_INVALID_CREDENTIALS,
-                MessageCode.INVALID_CREDENTIALS,
-                lang,
-            )
+        admin = None
+        if await username_filter.might_exist("admin", data.username):
+            admin = await TblAdmin.get_by_username(db, data.username)
 
-        access_token = await jwt_service.create_access_token(
-            user_id=admin.id, role=admin.role
-        )
-        refresh_token = await jwt_service.create_refresh_token(
+        # Unknown usernames still pay for one verification (uniform timing)
+        if admin is None:
+            await dummy_verify_async(data.password)
+            return AuthService._invalid_credentials(lang)
+
+        if not await verify_password_async(data.password, admin.hashed_password):
+            return AuthService._invalid_credentials(lang)
+
+        if needs_rehash(admin.hashed_password):
+            if await AuthService._rehash(TblAdmin, MyUserBase, db, admin.id, data.password):
+                await db.commit()
+                await AuthService._principal_changed("admin", admin.id)
+
+        access_token, refresh_token = await jwt_service.issue_token_pair(
             user_id=admin.id, role=admin.role
         )
 
@@ -140,6 +176,152 @@ class AuthService:
             ),
         )
 
+    # ======================================
+    # LOGIN REJECTED
+    # ======================================
+    @staticmethod
+    def _invalid_credentials(lang: str):
+
+        return ResponseBuilder.build(
+            ErrorType.AUTH_401_INVALID_CREDENTIALS,
+            MessageCode.INVALID_CREDENTIALS,
+            lang,
+        )
+
+    # ======================================
+    # LOGIN THROTTLED
+    # ======================================
+    @staticmethod
+    def _throttled(lang: str, retry_after: float):
+
+        response = ResponseBuilder.build(
+            ErrorType.AUTH_429_TOO_MANY_ATTEMPTS,
+            MessageCode.TOO_MANY_ATTEMPTS,
+            lang,
+        )
+        response.headers["Retry-After"] = str(math.ceil(retry_after))
+        return response
+
+    # ======================================
+    # USERNAME FILTERS (startup)
+    # ======================================
+    @staticmethod
+    async def build_username_filters():
+
+        async with get_session_maker()() as db:
+            await username_filter.build("user", TblUser.iter_usernames(db))
+
+        async with get_ctx_mysql_db() as db:
+            await username_filter.build("admin", TblAdmin.iter_usernames(db))
+
+    # ======================================
+    # REHASH (stale scrypt parameters)
+    # ======================================
+    @staticmethod
+    async def _rehash(model, base_model, db, record_id: int, password: str):
+
+        try:
+            new_hash = await hash_password_async(password)
+        except AppException:
+            # Pool saturated: keep the old hash, retry on a later login
+            return None
+
+        return await model.update(db, base_model(id=record_id, hashed_password=new_hash))
+
+    # ======================================
+    # PRINCIPAL CHANGED (after commit)
+    # ======================================
+    @staticmethod
+    async def _principal_changed(realm: str, record_id: int):
+
+        # Only once committed: invalidating earlier lets a concurrent load
+        # re-cache the old row, and the read-your-writes window must start
+        # when the write becomes visible
+        await principal_cache.invalidate(realm, record_id)
+        await read_your_writes.mark(realm, record_id)
+
+    # ======================================
+    # TOKEN REFRESH (no password, no DB)
+    # ======================================
+    @staticmethod
+    async def user_refresh(data: RefreshTokenRequest, lang: str):
+        return await AuthService._refresh(data, lang, admin=False)
+
+    @staticmethod
+    async def admin_refresh(data: RefreshTokenRequest, lang: str):
+        return await AuthService._refresh(data, lang, admin=True)
+
+    @staticmethod
+    async def _refresh(data: RefreshTokenRequest, lang: str, admin: bool):
+
+        payload = await jwt_service.verify_token(data.refresh_token, "refresh")
+
+        # Admin tokens only refresh on the admin route and vice versa
+        if (payload["role"] == "admin") != admin:
+            raise AppException(
+                ErrorType.AUTH_401_INVALID_TOKEN,
+                MessageCode.INVALID_TOKEN,
+                status.HTTP_401_UNAUTHORIZED,
+            )
+
+        jwt_service.token_cache.invalidate_token(data.refresh_token)
+        access_token, refresh_token = await jwt_service.rotate_token_pair(payload)
+
+        return ResponseBuilder.build(
+            ErrorType.SUC_200_SUCCESS,
+            MessageCode.TOKEN_REFRESHED,
+            lang,
+            data=TokenData(access_token=access_token, refresh_token=refresh_token),
+        )
+
+    # ======================================
+    # LOGOUT (current session)
+    # ======================================
+    @staticmethod
+    async def logout(principal: ClaimsPrincipal, lang: str):
+
+        await jwt_service.revoke_session(principal.realm, principal.id, principal.session_id)
+
+        return ResponseBuilder.build(
+            ErrorType.SUC_200_SUCCESS,
+            MessageCode.LOGOUT_SUCCESS,
+            lang,
+        )
+
+    # ======================================
+    # LOGOUT (every session)
+    # ======================================
+    @staticmethod
+    async def logout_all(principal: ClaimsPrincipal, lang: str):
+
+        await jwt_service.revoke_user(principal.realm, principal.id)
+
+        return ResponseBuilder.build(
+            ErrorType.SUC_200_SUCCESS,
+            MessageCode.LOGOUT_SUCCESS,
+            lang,
+        )
+
+    # ======================================
+    # ACTIVE SESSIONS
+    # ======================================
+    @staticmethod
+    async def list_sessions(principal: ClaimsPrincipal, lang: str):
+
+        sessions = await jwt_service.list_user_sessions(principal.realm, principal.id)
+
+        return ResponseBuilder.build(
+            ErrorType.SUC_200_SUCCESS,
+            MessageCode.DATA_FETCHED,
+            lang,
+            data=[
+                SessionResponse(
+                    **session, current=session["session_id"] == principal.session_id
+                )
+                for session in sessions
+            ],
+        )
+
     # ===============================
     # USER PROFILE
     # ===============================
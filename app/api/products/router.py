@@ -3,7 +3,7 @@ from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from app.api.products.schema import ProductCreateRequest, ProductUpdateRequest
 from app.api.products.service import ProductService
-from app.depends.jwt_depends import get_current_user
+from app.depends.jwt_depends import get_current_claims
 from app.depends.language_depends import get_language
 from app.depends.mongo_depends import get_mongo_db
 
@@ -13,7 +13,7 @@ router = APIRouter(prefix="/products", tags=["Products (MongoDB)"])
 @router.post("")
 async def create_product(
     data: ProductCreateRequest,
-    current_user=Depends(get_current_user),
+    current_user=Depends(get_current_claims),
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
     lang: str = Depends(get_language),
 ):
@@ -40,7 +40,7 @@ async def get_product(
 async def update_product(
     product_id: str,
     data: ProductUpdateRequest,
-    current_user=Depends(get_current_user),
+    current_user=Depends(get_current_claims),
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
     lang: str = Depends(get_language),
 ):
@@ -51,7 +51,7 @@ async def update_product(
 @router.delete("/{product_id}")
 async def delete_product(
     product_id: str,
-    current_user=Depends(get_current_user),
+    current_user=Depends(get_current_claims),
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
     lang: str = Depends(get_language),
 ):
@@ -2,9 +2,10 @@ from fastapi import APIRouter, Depends
 
 from app.core.error.error_types import ErrorType
 from app.core.error.message_codes import MessageCode
+from app.core.metrics import collect_metrics
 from app.core.response.response_builder import ResponseBuilder
 from app.database.mysql.base import MysqlBase
-from app.database.mysql.session import _engine
+from app.database.mysql.session import get_engine as get_mysql_engine
 from app.database.postgresql.session import create_tables, init_engine
 from app.depends.language_depends import get_language
 
@@ -22,7 +23,8 @@ async def start(
         await create_tables()
 
         # MySQL Tables
-        MysqlBase.metadata.create_all(bind=_engine)
+        async with get_mysql_engine().begin() as conn:
+            await conn.run_sync(MysqlBase.metadata.create_all)
 
         return ResponseBuilder.build(
             ErrorType.SUC_200_SUCCESS, MessageCode.RESOURCE_CREATED, lang
@@ -38,3 +40,13 @@ async def start(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database Initialization Error: {str(exc)}",
         )
+
+
+@router.get("/metrics")
+async def metrics(
+    lang: str = Depends(get_language),
+):
+
+    return ResponseBuilder.build(
+        ErrorType.SUC_200_SUCCESS, MessageCode.DATA_FETCHED, lang, data=collect_metrics()
+    )
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Response
+
+from app.depends.jwt_depends import jwt_service
+
+router = APIRouter(prefix="/.well-known", tags=["Well-Known"])
+
+
+@router.get("/jwks.json")
+async def jwks():
+    # Pre-rendered once by the key ring; served as the raw JWKS document
+    return Response(
+        content=jwt_service.keyring.jwks_json,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
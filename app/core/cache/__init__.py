@@ -0,0 +1,3 @@
+from .principal_cache import PrincipalCache, principal_cache
+from .token_cache import VerifiedTokenCache
+from .ttl_cache import TTLCache
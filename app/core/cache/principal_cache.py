@@ -0,0 +1,93 @@
+"""Read-through cache of authenticated principals (users and admins)."""
+
+import json
+from typing import Any
+
+from app.config import settings
+from app.core.logging.logger import get_logger
+from app.database.redis import get_redis
+
+from .ttl_cache import TTLCache
+
+logger = get_logger(__name__)
+
+
+class PrincipalCache:
+    """
+    Two-level cache of compact user/admin snapshots keyed by kind and id.
+
+    L1 is a per-worker TTL cache; L2 (optional) is Redis, shared by every
+    worker. Snapshots never contain the password hash. Entries are dropped
+    by the model `update` methods and by token revocation; the TTLs bound
+    staleness for writes that bypass both.
+    """
+
+    def __init__(self):
+        self.enabled = settings.PRINCIPAL_CACHE_ENABLED
+        self.local = TTLCache(settings.PRINCIPAL_CACHE_MAX_SIZE if self.enabled else 0)
+        self.ttl_seconds = settings.PRINCIPAL_CACHE_TTL_SECONDS
+        self.redis_enabled = self.enabled and settings.PRINCIPAL_CACHE_REDIS_ENABLED
+        self.redis_ttl_seconds = settings.PRINCIPAL_CACHE_REDIS_TTL_SECONDS
+        self.redis_hits = 0
+
+    @staticmethod
+    def _key(kind: str, principal_id: int | str) -> str:
+        return f"principal:{kind}:{principal_id}"
+
+    @staticmethod
+    def _redis():
+        return get_redis()
+
+    # ================= READ =================
+
+    async def get(self, kind: str, principal_id: int) -> dict[str, Any] | None:
+        key = self._key(kind, principal_id)
+
+        snapshot = self.local.get(key)
+        if snapshot is not None or not self.redis_enabled:
+            return snapshot
+
+        try:
+            raw = await self._redis().get(key)
+        except Exception as exc:
+            logger.warning("Principal cache L2 read failed: %s", exc)
+            return None
+
+        if raw is None:
+            return None
+
+        self.redis_hits += 1
+        snapshot = json.loads(raw)
+        self.local.set(key, snapshot, self.ttl_seconds)
+        return snapshot
+
+    # ================= WRITE =================
+
+    async def set(self, kind: str, principal_id: int, snapshot: dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+
+        key = self._key(kind, principal_id)
+        self.local.set(key, snapshot, self.ttl_seconds)
+
+        if self.redis_enabled:
+            try:
+                await self._redis().setex(key, self.redis_ttl_seconds, json.dumps(snapshot))
+            except Exception as exc:
+                logger.warning("Principal cache L2 write failed: %s", exc)
+
+    async def invalidate(self, kind: str, principal_id: int) -> None:
+        key = self._key(kind, principal_id)
+        self.local.pop(key)
+
+        if self.redis_enabled:
+            try:
+                await self._redis().delete(key)
+            except Exception as exc:
+                logger.warning("Principal cache L2 invalidation failed: %s", exc)
+
+    def stats(self) -> dict[str, Any]:
+        return {**self.local.stats(), "redis_hits": self.redis_hits}
+
+
+principal_cache = PrincipalCache()
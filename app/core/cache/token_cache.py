@@ -0,0 +1,79 @@
+"""Cache of already-verified JWT payloads keyed by token digest."""
+
+import hashlib
+import time
+from typing import Any, Callable, Hashable
+
+from .ttl_cache import TTLCache
+
+
+class VerifiedTokenCache(TTLCache):
+    """
+    Remembers decoded payloads of tokens that passed signature and session
+    checks, so repeat requests with the same bearer token skip both.
+
+    An entry lives until min(exp, now + revalidate_seconds). A side index from
+    subject to digests lets revocation drop every cached token of a user;
+    `subject_of` maps a payload to that subject key (default: its `sub`).
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        revalidate_seconds: int,
+        subject_of: Callable[[dict[str, Any]], str] | None = None,
+    ):
+        super().__init__(maxsize)
+        self.revalidate_seconds = revalidate_seconds
+        self.subject_of = subject_of or (lambda payload: str(payload["sub"]))
+        self._by_subject: dict[str, set[str]] = {}
+        self.rejected = 0
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get_payload(self, token: str) -> dict[str, Any] | None:
+        return self.get(self.digest(token))
+
+    def put_payload(self, token: str, payload: dict[str, Any]) -> None:
+        ttl = min(payload["exp"] - time.time(), self.revalidate_seconds)
+        digest = self.digest(token)
+        self.set(digest, payload, ttl)
+        if digest in self._data:
+            self._by_subject.setdefault(self.subject_of(payload), set()).add(digest)
+
+    def reject(self) -> None:
+        """Re-count the last hit as a miss: the caller could not trust it."""
+        self.hits -= 1
+        self.misses += 1
+        self.rejected += 1
+
+    def invalidate_token(self, token: str) -> None:
+        self.pop(self.digest(token))
+
+    def invalidate_subject(self, subject: int | str) -> int:
+        digests = self._by_subject.pop(str(subject), set())
+        for digest in digests:
+            self.pop(digest)
+        return len(digests)
+
+    def clear(self) -> None:
+        super().clear()
+        self._by_subject.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {**super().stats(), "rejected": self.rejected}
+
+    # ================= INTERNAL =================
+
+    def _remove(self, key: Hashable) -> None:
+        _, payload = self._data[key]
+        super()._remove(key)
+
+        subject = self.subject_of(payload)
+        digests = self._by_subject.get(subject)
+        if digests is not None:
+            digests.discard(key)
+            if not digests:
+                del self._by_subject[subject]
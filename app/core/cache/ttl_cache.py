@@ -0,0 +1,81 @@
+"""Bounded in-process cache with per-entry expiry."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    LRU cache where every entry carries its own deadline.
+
+    Entries are evicted when they expire (lazily, on access) or when the cache
+    is full (least recently used first). Not thread-safe: it is meant to be
+    used from the event loop of a single worker.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        deadline, value = entry
+        if deadline <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0 or self.maxsize <= 0:
+            return
+
+        if key in self._data:
+            self._data.move_to_end(key)
+        self._data[key] = (time.monotonic() + ttl_seconds, value)
+
+        while len(self._data) > self.maxsize:
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self._data:
+            return default
+        _, value = self._data[key]
+        self._remove(key)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    # ================= INTERNAL =================
+
+    def _remove(self, key: Hashable) -> None:
+        """Single removal path so subclasses can keep side indexes in sync."""
+        del self._data[key]
@@ -30,5 +30,11 @@ class ErrorType(StrEnum):
     # 404
     RES_404_USER_NOT_FOUND = "USER_NOT_FOUND"
 
+    # 429
+    AUTH_429_TOO_MANY_ATTEMPTS = "TOO_MANY_ATTEMPTS"
+
     # 500
-    SYS_500_INTERNAL_ERROR = "INTERNAL_SERVER_ERROR"
\ No newline at end of file
+    SYS_500_INTERNAL_ERROR = "INTERNAL_SERVER_ERROR"
+
+    # 503
+    SYS_503_SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
\ No newline at end of file
@@ -10,6 +10,7 @@ class MessageCode(StrEnum):
     OPERATION_SUCCESS = "OPERATION_SUCCESS"
     LOGIN_SUCCESS = "LOGIN_SUCCESS"
     LOGOUT_SUCCESS = "LOGOUT_SUCCESS"
+    TOKEN_REFRESHED = "TOKEN_REFRESHED"
     DATA_FETCHED = "DATA_FETCHED"
     DATA_UPDATED = "DATA_UPDATED"
     DATA_DELETED = "DATA_DELETED"
@@ -31,6 +32,7 @@ class MessageCode(StrEnum):
     INVALID_TOKEN = "INVALID_TOKEN"
     SESSION_INVALID = "SESSION_INVALID"
     USERNAME_EXISTS = "USERNAME_EXISTS"
+    TOO_MANY_ATTEMPTS = "TOO_MANY_ATTEMPTS"
 
     # =========================
     # SYSTEM
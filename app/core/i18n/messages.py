@@ -30,6 +30,12 @@ MESSAGES: dict[MessageCode, dict[str, str]] = {
         "hi": "लॉगआउट सफल हुआ",
     },
 
+    MessageCode.TOKEN_REFRESHED: {
+        "en": "Token refreshed successfully",
+        "ar": "تم تحديث الرمز بنجاح",
+        "hi": "टोकन सफलतापूर्वक रीफ़्रेश हुआ",
+    },
+
     MessageCode.DATA_FETCHED: {
         "en": "Data fetched successfully",
         "ar": "تم جلب البيانات بنجاح",
@@ -113,6 +119,12 @@ MESSAGES: dict[MessageCode, dict[str, str]] = {
         "hi": "इस उपयोगकर्ता का उपयोगकर्ता आईडी पहले से मौजूद है",
     },
 
+    MessageCode.TOO_MANY_ATTEMPTS: {
+        "en": "Too many login attempts, please try again later",
+        "ar": "محاولات تسجيل دخول كثيرة جدًا، يرجى المحاولة لاحقًا",
+        "hi": "बहुत अधिक लॉगिन प्रयास, कृपया बाद में पुनः प्रयास करें",
+    },
+
     # =========================
     # SYSTEM
     # =========================
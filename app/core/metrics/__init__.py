@@ -0,0 +1 @@
+from .collector import collect_metrics
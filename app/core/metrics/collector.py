@@ -0,0 +1,48 @@
+"""Point-in-time snapshot of pool, cache and executor telemetry."""
+
+from typing import Any
+
+
+def collect_metrics() -> dict[str, Any]:
+    # Imported lazily: these modules sit above app.core in the import graph
+    from app.core.cache.principal_cache import principal_cache
+    from app.core.security.login_throttle import login_throttle
+    from app.core.security.username_filter import username_filter
+    from app.database.mysql.session import get_pool_stats as mysql_pool_stats
+    from app.database.mysql.session import get_replica_router as mysql_replicas
+    from app.database.postgresql.session import get_pool_stats as postgres_pool_stats
+    from app.database.postgresql.session import get_replica_router as postgres_replicas
+    from app.database.redis import redis_pool_stats
+    from app.depends.jwt_depends import jwt_service
+    from app.utils.crypto_utils import bulk_password_executor, password_executor
+
+    return {
+        "pools": {
+            "postgres": postgres_pool_stats(),
+            "mysql": mysql_pool_stats(),
+            "redis": redis_pool_stats(),
+        },
+        "replicas": {
+            name: router.stats() if router is not None else None
+            for name, router in (
+                ("postgres", postgres_replicas()),
+                ("mysql", mysql_replicas()),
+            )
+        },
+        "executors": {
+            "jwt_crypto": jwt_service.crypto.stats(),
+            "password_hash": password_executor.stats(),
+            "password_bulk": bulk_password_executor.stats(),
+        },
+        "caches": {
+            "token": jwt_service.token_cache.stats(),
+            "principal": principal_cache.stats(),
+        },
+        "security": {
+            "login_throttle": login_throttle.stats(),
+            "username_filter": username_filter.stats(),
+            "revocations": jwt_service.revocations.stats()
+            if jwt_service.revocations is not None
+            else None,
+        },
+    }
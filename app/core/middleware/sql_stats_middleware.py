@@ -0,0 +1,42 @@
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.config import settings
+from app.core.logging.logger import get_logger
+from app.database.instrumentation import begin_request, compact, end_request
+
+logger = get_logger("app.sql")
+
+
+class SQLStatsMiddleware(BaseHTTPMiddleware):
+    """
+    Collects the SQL issued while handling a request: statement count and
+    DB time go out as `Server-Timing: db`, and identical statements repeated
+    `SQL_N_PLUS_ONE_THRESHOLD` times or more are logged as N+1 suspects.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        stats, token = begin_request()
+        try:
+            response = await call_next(request)
+        finally:
+            end_request(token)
+
+        if stats.count:
+            response.headers.append(
+                "Server-Timing",
+                f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries"',
+            )
+
+        for statement, count in stats.n_plus_one_suspects(
+            settings.SQL_N_PLUS_ONE_THRESHOLD
+        ):
+            logger.warning(
+                "N+1 suspect | %s %s | %dx %s",
+                request.method,
+                request.url.path,
+                count,
+                compact(statement, 200),
+            )
+
+        return response
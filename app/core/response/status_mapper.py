@@ -16,7 +16,11 @@ def get_http_status(error_type: ErrorType) -> int:
         return 403
     if "_404_" in name:
         return 404
+    if "_429_" in name:
+        return 429
     if "_500_" in name:
         return 500
+    if "_503_" in name:
+        return 503
 
     return 200
\ No newline at end of file
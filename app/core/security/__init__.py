@@ -0,0 +1,3 @@
+from .login_throttle import LoginThrottle, login_throttle
+from .revocation import RevocationListener
+from .username_filter import UsernameFilter, username_filter
@@ -0,0 +1,181 @@
+"""JWT signing/verification keys, parsed once and published as a JWKS."""
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm, RSAAlgorithm
+
+RSA_ALGORITHMS = {"RS256", "RS384", "RS512", "PS256", "PS384", "PS512"}
+EC_ALGORITHMS = {"secp256r1": "ES256", "secp384r1": "ES384", "secp521r1": "ES512"}
+
+
+@dataclass(frozen=True)
+class VerificationKey:
+    kid: str
+    algorithm: str
+    key: Any  # cryptography public key object
+
+
+def _load_pem(pem: str) -> str:
+    return pem.replace("\\n", "\n").strip()
+
+
+def _to_jwk(public_key) -> dict[str, Any]:
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return RSAAlgorithm.to_jwk(public_key, as_dict=True)
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        return ECAlgorithm.to_jwk(public_key, as_dict=True)
+    return OKPAlgorithm.to_jwk(public_key, as_dict=True)
+
+
+def _thumbprint(jwk: dict[str, Any]) -> str:
+    """RFC 7638 JWK thumbprint, used as the default `kid`."""
+    required = {
+        "RSA": ("e", "kty", "n"),
+        "EC": ("crv", "kty", "x", "y"),
+        "OKP": ("crv", "kty", "x"),
+    }[jwk["kty"]]
+    canonical = json.dumps(
+        {name: jwk[name] for name in required}, separators=(",", ":"), sort_keys=True
+    )
+    digest = hashlib.sha256(canonical.encode()).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def _algorithm_for(public_key, preferred: str) -> str:
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return preferred if preferred in RSA_ALGORITHMS else "RS256"
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        return EC_ALGORITHMS[public_key.curve.name]
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return "EdDSA"
+    raise ValueError(f"Unsupported JWT key type: {type(public_key).__name__}")
+
+
+class KeyRing:
+    """
+    Holds the active signing key and every key tokens may be verified with.
+
+    PEM material is parsed into cryptography key objects once, at startup,
+    so PyJWT does not re-parse it on every encode/decode. The active key and
+    any retired keys (`verification_keys`, kid -> public PEM) are addressed by
+    `kid`, which lets keys rotate without invalidating live tokens. The JWKS
+    document is rendered once and served as-is.
+    """
+
+    def __init__(
+        self,
+        private_key_pem: str,
+        public_key_pem: str = "",
+        algorithm: str = "RS256",
+        key_id: str = "",
+        verification_keys: dict[str, str] | None = None,
+    ):
+        # Kept so process-pool workers can build an identical ring
+        self.config = {
+            "private_key_pem": private_key_pem,
+            "public_key_pem": public_key_pem,
+            "algorithm": algorithm,
+            "key_id": key_id,
+            "verification_keys": verification_keys,
+        }
+        self.algorithm = algorithm
+        self.signing_key = None
+        self.signing_kid: str | None = None
+        self._keys: dict[str, VerificationKey] = {}
+
+        public_key = None
+        if private_key_pem:
+            self.signing_key = serialization.load_pem_private_key(
+                _load_pem(private_key_pem).encode(), password=None
+            )
+            public_key = self.signing_key.public_key()
+        elif public_key_pem:
+            public_key = serialization.load_pem_public_key(
+                _load_pem(public_key_pem).encode()
+            )
+
+        if public_key is not None:
+            if _algorithm_for(public_key, algorithm) != algorithm:
+                raise ValueError(
+                    f"APP_JWT_ALGORITHM {algorithm} does not match the configured key"
+                )
+            self.signing_kid = key_id or _thumbprint(_to_jwk(public_key))
+            self._add(self.signing_kid, public_key)
+
+        for kid, pem in (verification_keys or {}).items():
+            self._add(kid, serialization.load_pem_public_key(_load_pem(pem).encode()))
+
+        self.jwks = {"keys": [self._jwk(key) for key in self._keys.values()]}
+        self.jwks_json = json.dumps(self.jwks, separators=(",", ":")).encode()
+
+    # ================= LOOKUP =================
+
+    def get(self, kid: str | None) -> VerificationKey | None:
+        """Resolve the key for a token header; tokens without kid use the active key."""
+        return self._keys.get(kid or self.signing_kid or "")
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"kid": self.signing_kid} if self.signing_kid else {}
+
+    # ================= SIGN / VERIFY =================
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        return jwt.encode(
+            payload, self.signing_key, algorithm=self.algorithm, headers=self.headers
+        )
+
+    def decode(self, token: str, issuer: str, audience: str) -> dict[str, Any]:
+        key = self.get(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
+            raise jwt.InvalidTokenError("Unknown signing key")
+
+        return jwt.decode(
+            token,
+            key.key,
+            algorithms=[key.algorithm],
+            issuer=issuer,
+            audience=audience,
+        )
+
+    # ================= INTERNAL =================
+
+    def _add(self, kid: str, public_key) -> None:
+        self._keys[kid] = VerificationKey(
+            kid=kid,
+            algorithm=_algorithm_for(public_key, self.algorithm),
+            key=public_key,
+        )
+
+    @staticmethod
+    def _jwk(key: VerificationKey) -> dict[str, Any]:
+        return {**_to_jwk(key.key), "kid": key.kid, "alg": key.algorithm, "use": "sig"}
+
+
+# ============================================================
+# PROCESS POOL WORKERS
+# ============================================================
+# Key objects cannot be pickled, so each worker process parses its own ring
+# once (pool initializer) and tasks refer to it implicitly.
+
+_worker_keyring: KeyRing | None = None
+
+
+def init_worker_keyring(config: dict[str, Any]) -> None:
+    global _worker_keyring
+    _worker_keyring = KeyRing(**config)
+
+
+def worker_encode(payload: dict[str, Any]) -> str:
+    return _worker_keyring.encode(payload)
+
+
+def worker_decode(token: str, issuer: str, audience: str) -> dict[str, Any]:
+    return _worker_keyring.decode(token, issuer, audience)
@@ -0,0 +1,169 @@
+"""Sliding-window limiter for login attempts, checked before any KDF work."""
+
+import ipaddress
+import time
+import uuid
+from collections import deque
+
+from fastapi import Request
+
+from app.config import settings
+from app.core.cache.ttl_cache import TTLCache
+from app.core.logging.logger import get_logger
+from app.database.redis import get_redis
+
+logger = get_logger(__name__)
+
+# KEYS: one sorted set per throttled dimension (username, client IP)
+# ARGV: now_ms, window_ms, member, then one limit per key
+# Returns 0 when the attempt is admitted, else the ms until a slot frees up.
+# Nothing is recorded for a rejected attempt, so a flood cannot extend its
+# own lockout indefinitely.
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local retry = 0
+for i, key in ipairs(KEYS) do
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) >= tonumber(ARGV[3 + i]) then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        retry = math.max(retry, tonumber(oldest[2]) + window - now)
+    end
+end
+if retry > 0 then
+    return retry
+end
+for _, key in ipairs(KEYS) do
+    redis.call('ZADD', key, now, ARGV[3])
+    redis.call('PEXPIRE', key, window)
+end
+return 0
+"""
+
+
+class LoginThrottle:
+    """
+    Limits login attempts per username and per client IP over a sliding
+    window, atomically in Redis. If Redis is unreachable the same window is
+    enforced per worker in memory, which is weaker but keeps the scrypt pool
+    protected.
+
+    The client IP is the peer address unless that peer is one of
+    `LOGIN_TRUSTED_PROXIES`; then it is the nearest X-Forwarded-For hop not
+    added by a trusted proxy, so clients behind a load balancer do not share
+    one bucket and a client cannot pick its own by forging the header.
+    """
+
+    def __init__(self):
+        self.enabled = settings.LOGIN_THROTTLE_ENABLED
+        self.window_ms = settings.LOGIN_THROTTLE_WINDOW_SECONDS * 1000
+        self.max_per_username = settings.LOGIN_THROTTLE_MAX_PER_USERNAME
+        self.max_per_ip = settings.LOGIN_THROTTLE_MAX_PER_IP
+        self.trusted_proxies = [
+            ipaddress.ip_network(proxy, strict=False)
+            for proxy in settings.LOGIN_TRUSTED_PROXIES
+        ]
+
+        self._script = None
+        self._local = TTLCache(settings.LOGIN_THROTTLE_LOCAL_MAX_KEYS)
+
+        self.allowed = 0
+        self.rejected = 0
+        self.fallbacks = 0
+
+    @staticmethod
+    def _redis():
+        return get_redis()
+
+    # ================= CLIENT IP =================
+
+    def client_ip(self, request: Request) -> str:
+        peer = request.client.host if request.client else "unknown"
+        if not self._is_trusted(peer):
+            return peer
+
+        hops = [
+            hop.strip()
+            for header in request.headers.getlist("x-forwarded-for")
+            for hop in header.split(",")
+            if hop.strip()
+        ]
+        # Walk back from the nearest hop; the first untrusted one is the client
+        for hop in reversed(hops):
+            if not self._is_trusted(hop):
+                return hop
+        return hops[0] if hops else peer
+
+    def _is_trusted(self, address: str) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self.trusted_proxies)
+
+    # ================= CHECK =================
+
+    async def hit(self, realm: str, username: str, client_ip: str) -> float:
+        """Record an attempt; return 0 if admitted, else seconds to wait."""
+
+        if not self.enabled:
+            return 0
+
+        limits = {
+            f"login:attempts:{realm}:user:{username.lower()}": self.max_per_username,
+            f"login:attempts:ip:{client_ip}": self.max_per_ip,
+        }
+        now_ms = int(time.time() * 1000)
+
+        try:
+            redis = self._redis()
+            if self._script is None or self._script.registered_client is not redis:
+                self._script = redis.register_script(SLIDING_WINDOW_SCRIPT)
+            retry_ms = await self._script(
+                keys=list(limits),
+                args=[now_ms, self.window_ms, f"{now_ms}-{uuid.uuid4().hex[:8]}"]
+                + list(limits.values()),
+            )
+        except Exception as exc:
+            logger.warning("Login throttle falling back to memory: %s", exc)
+            self.fallbacks += 1
+            retry_ms = self._hit_local(limits, now_ms)
+
+        if retry_ms:
+            self.rejected += 1
+            return retry_ms / 1000
+
+        self.allowed += 1
+        return 0
+
+    def stats(self) -> dict:
+        return {
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "fallbacks": self.fallbacks,
+            "local_keys": len(self._local),
+        }
+
+    # ================= INTERNAL =================
+
+    def _hit_local(self, limits: dict[str, int], now_ms: int) -> int:
+        windows = []
+        retry_ms = 0
+        for key, limit in limits.items():
+            window = self._local.get(key) or deque()
+            while window and window[0] <= now_ms - self.window_ms:
+                window.popleft()
+            if len(window) >= limit:
+                retry_ms = max(retry_ms, window[0] + self.window_ms - now_ms)
+            windows.append((key, window))
+
+        if retry_ms:
+            return retry_ms
+
+        for key, window in windows:
+            window.append(now_ms)
+            self._local.set(key, window, self.window_ms / 1000)
+        return 0
+
+
+login_throttle = LoginThrottle()
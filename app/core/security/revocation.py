@@ -0,0 +1,130 @@
+"""Per-worker deny-list of revoked token ids fed by a Redis stream."""
+
+import asyncio
+import heapq
+import time
+
+from app.core.logging.logger import get_logger
+from app.database.redis import get_redis
+
+logger = get_logger(__name__)
+
+
+class RevocationListener:
+    """
+    Keeps a local copy of every revoked, not yet expired jti.
+
+    `JWTService.revoke_user` appends one entry per revocation to a Redis
+    stream. Each worker tails that stream with a blocking XREAD and remembers
+    the last entry id it applied, so after a dropped connection it resumes
+    from there and catches up on everything it missed. On first start it
+    replays the retention window (the longest token lifetime).
+
+    The deny-list is only trusted while the listener is fresh, i.e. it has
+    caught up with the stream (a read returned less than a full batch)
+    within `max_lag_seconds`; callers fall back to the authoritative Redis
+    session check otherwise. A replay that is still paging through full
+    batches never counts as fresh.
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        stream_key: str,
+        retention_seconds: int,
+        max_lag_seconds: float,
+    ):
+        self.stream_key = stream_key
+        self.retention_seconds = retention_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self.block_ms = max(int(max_lag_seconds * 1000 / 2), 100)
+
+        self._revoked: dict[str, int] = {}  # jti -> exp
+        self._expiries: list[tuple[int, str]] = []  # heap of (exp, jti)
+        self._last_id: str | None = None
+        self._last_read: float = 0.0
+        self._task: asyncio.Task | None = None
+
+    # ================= STATE =================
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self._last_read <= self.max_lag_seconds
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    def deny(self, sessions: str) -> None:
+        """Apply an encoded "<type>:<jti>[:...]@<exp>,..." session list."""
+        for entry in filter(None, sessions.split(",")):
+            member, _, exp = entry.rpartition("@")
+            jti = member.split(":")[1]
+            exp = int(float(exp))
+            if self._revoked.get(jti) != exp:
+                self._revoked[jti] = exp
+                heapq.heappush(self._expiries, (exp, jti))
+
+    def purge_expired(self) -> None:
+        """Drop expired jtis; only the expired heap entries are touched."""
+        now = int(time.time())
+        while self._expiries and self._expiries[0][0] <= now:
+            exp, jti = heapq.heappop(self._expiries)
+            # A later deny may have moved the jti to another expiry
+            if self._revoked.get(jti) == exp:
+                del self._revoked[jti]
+
+    def stats(self) -> dict:
+        return {
+            "revoked_jtis": len(self._revoked),
+            "fresh": self.is_fresh(),
+            "last_id": self._last_id,
+        }
+
+    # ================= LIFECYCLE =================
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="revocation-listener")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        if self._last_id is None:
+            replay_from = int((time.time() - self.retention_seconds) * 1000)
+            self._last_id = f"{max(replay_from, 0)}-0"
+
+        backoff = 0.5
+        while True:
+            try:
+                response = await get_redis().xread(
+                    {self.stream_key: self._last_id},
+                    count=self.BATCH_SIZE,
+                    block=self.block_ms,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Revocation stream read failed, retrying: %s", exc)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 10)
+                continue
+
+            backoff = 0.5
+            applied = 0
+            for _, entries in response:
+                for entry_id, fields in entries:
+                    self.deny(fields.get("sessions", ""))
+                    self._last_id = entry_id
+                    applied += 1
+
+            # A full batch means more entries may be waiting: not caught up yet
+            if applied < self.BATCH_SIZE:
+                self._last_read = time.monotonic()
+            self.purge_expired()
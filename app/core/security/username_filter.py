@@ -0,0 +1,139 @@
+"""Shared Bloom filter of known usernames, used to skip DB lookups."""
+
+import hashlib
+from typing import AsyncIterator
+
+from app.config import settings
+from app.core.logging.logger import get_logger
+from app.database.redis import get_redis
+
+logger = get_logger(__name__)
+
+
+class UsernameFilter:
+    """
+    Bloom filter per realm ("user" / "admin"), stored as a Redis bitmap so
+    every worker sees registrations immediately.
+
+    A negative answer is definitive only while the realm's `ready` marker
+    exists: it is set after a full build from the table and removed whenever
+    an `add` fails, so a filter that may have missed a username is never
+    trusted. Rows inserted without going through `add` (manual SQL) are
+    invisible until the next rebuild. Any Redis error answers "maybe", which
+    falls back to the database.
+
+    The marker lives two rebuild periods and `build` runs again once it is
+    past the first, so a periodic `build` call (see the app lifespan)
+    refreshes the filter before the marker can lapse.
+    """
+
+    def __init__(self):
+        self.enabled = settings.USERNAME_FILTER_ENABLED
+        self.bits = settings.USERNAME_FILTER_BITS
+        self.hashes = settings.USERNAME_FILTER_HASHES
+        self.rebuild_seconds = settings.USERNAME_FILTER_REBUILD_SECONDS
+
+        self.negatives = 0
+        self.positives = 0
+
+    @staticmethod
+    def _redis():
+        return get_redis()
+
+    @staticmethod
+    def _key(realm: str) -> str:
+        return f"usernames:bloom:{realm}"
+
+    def _offsets(self, username: str) -> list[int]:
+        # Kirsch-Mitzenmacher double hashing from one 128-bit digest
+        digest = hashlib.blake2b(username.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    # ================= QUERY =================
+
+    async def might_exist(self, realm: str, username: str) -> bool:
+
+        if not self.enabled:
+            return True
+
+        key = self._key(realm)
+        try:
+            async with self._redis().pipeline(transaction=False) as pipe:
+                pipe.exists(f"{key}:ready")
+                for offset in self._offsets(username):
+                    pipe.getbit(key, offset)
+                ready, *bits = await pipe.execute()
+        except Exception as exc:
+            logger.warning("Username filter unavailable: %s", exc)
+            return True
+
+        if ready and not all(bits):
+            self.negatives += 1
+            return False
+
+        self.positives += 1
+        return True
+
+    # ================= UPDATE =================
+
+    async def add(self, realm: str, *usernames: str) -> None:
+
+        if not self.enabled or not usernames:
+            return
+
+        key = self._key(realm)
+        try:
+            async with self._redis().pipeline(transaction=False) as pipe:
+                for username in usernames:
+                    for offset in self._offsets(username):
+                        pipe.setbit(key, offset, 1)
+                await pipe.execute()
+        except Exception as exc:
+            logger.warning("Username filter add failed, invalidating: %s", exc)
+            try:
+                await self._redis().delete(f"{key}:ready")
+            except Exception:
+                logger.error("Username filter for %s may be stale until rebuilt", realm)
+
+    @property
+    def check_interval(self) -> int:
+        """How often workers should call `build` (a no-op while fresh)."""
+        return max(self.rebuild_seconds // 10, 60)
+
+    async def build(self, realm: str, usernames: AsyncIterator[str]) -> int:
+        """Add every username from the source, then mark the filter ready."""
+
+        key = self._key(realm)
+        redis = self._redis()
+
+        # One builder per realm across workers; skipped while the marker is
+        # younger than one rebuild period (missing marker: TTL -2)
+        if await redis.ttl(f"{key}:ready") > self.rebuild_seconds:
+            return 0
+        if not await redis.set(f"{key}:lock", 1, nx=True, ex=600):
+            return 0
+
+        count = 0
+        try:
+            pipe = redis.pipeline(transaction=False)
+            async for username in usernames:
+                for offset in self._offsets(username):
+                    pipe.setbit(key, offset, 1)
+                count += 1
+                if count % 1000 == 0:
+                    await pipe.execute()
+            await pipe.execute()
+            await redis.set(f"{key}:ready", 1, ex=self.rebuild_seconds * 2)
+        finally:
+            await redis.delete(f"{key}:lock")
+
+        logger.info("Username filter for %s built from %d usernames", realm, count)
+        return count
+
+    def stats(self) -> dict:
+        return {"negatives": self.negatives, "positives": self.positives}
+
+
+username_filter = UsernameFilter()
@@ -0,0 +1,105 @@
+"""Per-request SQL accounting via engine events and a context variable."""
+
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings as CONFIG_SETTINGS
+from app.core.logging.logger import get_logger
+
+logger = get_logger("app.sql")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class RequestSQLStats:
+    count: int = 0
+    total_ms: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.statements[statement] += 1
+
+    def n_plus_one_suspects(self, threshold: int) -> list[tuple[str, int]]:
+        """Identical statements issued at least `threshold` times."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+_current: ContextVar[RequestSQLStats | None] = ContextVar("sql_stats", default=None)
+
+
+def begin_request() -> tuple[RequestSQLStats, Token]:
+    stats = RequestSQLStats()
+    return stats, _current.set(stats)
+
+
+def end_request(token: Token) -> None:
+    _current.reset(token)
+
+
+def current_stats() -> RequestSQLStats | None:
+    return _current.get()
+
+
+# ============================================================
+# ENGINE HOOKS
+# ============================================================
+
+def compact(statement: str, limit: int = 500) -> str:
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return statement if len(statement) <= limit else f"{statement[:limit]}..."
+
+
+def redact(parameters: Any, executemany: bool = False) -> Any:
+    """Bound values replaced by their type names; never log user data."""
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def instrument_engine(engine: AsyncEngine | Engine) -> None:
+    """Time every statement; attribute it to the current request, if any."""
+    if not CONFIG_SETTINGS.SQL_INSTRUMENTATION_ENABLED:
+        return
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    slow_ms = CONFIG_SETTINGS.SQL_SLOW_QUERY_MS
+    database = sync_engine.dialect.name
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        context._sql_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - context._sql_started) * 1000
+
+        stats = _current.get()
+        if stats is not None:
+            stats.record(statement, elapsed_ms)
+
+        if slow_ms and elapsed_ms >= slow_ms:
+            logger.warning(
+                "Slow %s statement (%.1fms): %s | params=%s",
+                database,
+                elapsed_ms,
+                compact(statement),
+                redact(parameters, executemany),
+            )
@@ -1 +1,8 @@
-from .session import get_ctx_mysql_db, get_mysql_db
+from .session import (
+    dispose_engine,
+    get_ctx_mysql_db,
+    get_ctx_mysql_read_db,
+    get_engine,
+    get_mysql_db,
+    get_mysql_read_db,
+)
@@ -1,15 +1,23 @@
-from collections.abc import Generator
-from contextlib import contextmanager
+"""Async MySQL helper using SQLAlchemy AsyncEngine (aiomysql driver)."""
+
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from urllib.parse import quote_plus
 
-from fastapi import status
-from pymysql import OperationalError
-from sqlalchemy import create_engine
-from sqlalchemy.exc import OperationalError as SQLAlchemyOperationalError
-from sqlalchemy.orm import Session, sessionmaker
+from fastapi import Request, status
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.config import settings as CONFIG_SETTINGS
 from app.core.logging.logger import get_logger
+from app.database.instrumentation import instrument_engine
+from app.database.pool import attach_pool_events, pool_options, pool_stats
+from app.database.replicas import ReplicaRouter, read_session, sticky_key_from_request
 
 logger = get_logger(__name__)
 
@@ -35,48 +43,102 @@ def build_sqlalchemy_database_url_from_settings():
 
     encoded_password = quote_plus(db_pass.encode()) if db_pass else None
     if not db_pass:
-        database_url = f"mysql+pymysql://{db_user}@{db_host}:{db_port}/{db_name}"
+        database_url = f"mysql+aiomysql://{db_user}@{db_host}:{db_port}/{db_name}"
     else:
-        database_url = f"mysql+pymysql://{db_user}:{encoded_password}@{db_host}:{db_port}/{db_name}"
+        database_url = f"mysql+aiomysql://{db_user}:{encoded_password}@{db_host}:{db_port}/{db_name}"
 
     return database_url
 
 
 SQLALCHEMY_DATABASE_URL = build_sqlalchemy_database_url_from_settings()
 
-try:
-    _engine = create_engine(
-        SQLALCHEMY_DATABASE_URL,
-        future=True,
-        pool_recycle=3600,
-    )
-    _session_local = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
-except Exception as _exc:
-    # Defer the import to avoid circular imports at module level
-    from app.core.error.error_types import ErrorType
-    from app.core.error.message_codes import MessageCode
-    from app.core.middleware.exception_middleware import AppException
 
-    logger.critical(
-        "MySQL engine creation failed — check MYSQL_HOST / MYSQL_DB / credentials. "
-        "Error: %s",
-        _exc,
+def _create_engine(url: str) -> AsyncEngine:
+    """Engine with the configured pool policy."""
+    engine = create_async_engine(
+        url,
+        **pool_options(
+            size=CONFIG_SETTINGS.MYSQL_POOL_SIZE,
+            max_overflow=CONFIG_SETTINGS.MYSQL_MAX_OVERFLOW,
+            timeout=CONFIG_SETTINGS.MYSQL_POOL_TIMEOUT,
+            recycle=CONFIG_SETTINGS.MYSQL_POOL_RECYCLE,
+            pre_ping=CONFIG_SETTINGS.MYSQL_POOL_PRE_PING,
+        ),
     )
-    raise AppException(
-        ErrorType.SYS_500_INTERNAL_ERROR,
-        MessageCode.INTERNAL_ERROR,
-        status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail=f"MySQL connection error: {_exc}",
-    ) from _exc
+    attach_pool_events(engine)
+    instrument_engine(engine)
+    return engine
 
 
-def get_mysql_db() -> Generator[Session, None, None]:
+_engine: AsyncEngine | None = None
+_session_local: async_sessionmaker[AsyncSession] | None = None
+
+
+def init_engine() -> AsyncEngine:
+    """
+    Create the engine on first use (or from the app lifespan).
+
+    Importing this module costs no driver import or engine setup, and a
+    misconfigured MySQL only fails the code paths that actually need it.
+    """
+    global _engine, _session_local
+
+    if _engine is None:
+        try:
+            _engine = _create_engine(SQLALCHEMY_DATABASE_URL)
+            _session_local = async_sessionmaker(
+                _engine, autoflush=False, expire_on_commit=False
+            )
+        except Exception as exc:
+            # Defer the import to avoid circular imports at module level
+            from app.core.error.error_types import ErrorType
+            from app.core.error.message_codes import MessageCode
+            from app.core.middleware.exception_middleware import AppException
+
+            logger.critical(
+                "MySQL engine creation failed — check MYSQL_HOST / MYSQL_DB / credentials. "
+                "Error: %s",
+                exc,
+            )
+            raise AppException(
+                ErrorType.SYS_500_INTERNAL_ERROR,
+                MessageCode.INTERNAL_ERROR,
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"MySQL connection error: {exc}",
+            ) from exc
+
+    return _engine
+
+
+def get_engine() -> AsyncEngine:
+    if _engine is None:
+        return init_engine()
+    return _engine
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    if _session_local is None:
+        init_engine()
+    return _session_local  # type: ignore[return-value]
+
+
+async def dispose_engine() -> None:
+    """Close pooled connections; the next use creates a fresh engine."""
+    global _engine, _session_local
+
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+        _session_local = None
+
+
+async def get_mysql_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Get the MySQL database session.
 
     Yields
     ------
-        db: The active SQLAlchemy Session.
+        db: The active SQLAlchemy AsyncSession.
 
     Raises
     ------
@@ -87,44 +149,83 @@ def get_mysql_db() -> Generator[Session, None, None]:
     from app.core.error.message_codes import MessageCode
     from app.core.middleware.exception_middleware import AppException
 
-    db = _session_local()
-    try:
-        yield db
-    except (OperationalError, SQLAlchemyOperationalError) as exc:
-        logger.exception("MySQL OperationalError: %s", exc)
-        raise AppException(
-            ErrorType.SYS_500_INTERNAL_ERROR,
-            MessageCode.INTERNAL_ERROR,
-            status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"MySQL error: {exc}",
-        ) from exc
-    except Exception as exc:
-        logger.exception("Unexpected MySQL session error: %s", exc)
-        raise
-    finally:
-        db.close()
-
-
-@contextmanager
-def get_ctx_mysql_db() -> Generator[Session, None, None]:
+    async with get_session_maker()() as db:
+        try:
+            yield db
+        except OperationalError as exc:
+            logger.exception("MySQL OperationalError: %s", exc)
+            await db.rollback()
+            raise AppException(
+                ErrorType.SYS_500_INTERNAL_ERROR,
+                MessageCode.INTERNAL_ERROR,
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"MySQL error: {exc}",
+            ) from exc
+        except Exception as exc:
+            logger.exception("Unexpected MySQL session error: %s", exc)
+            await db.rollback()
+            raise
+
+
+@asynccontextmanager
+async def get_ctx_mysql_db() -> AsyncGenerator[AsyncSession, None]:
     """Get the MySQL database session within a context manager."""
     from app.core.error.error_types import ErrorType
     from app.core.error.message_codes import MessageCode
     from app.core.middleware.exception_middleware import AppException
 
-    db = _session_local()
-    try:
-        yield db
-    except (OperationalError, SQLAlchemyOperationalError) as exc:
-        logger.exception("MySQL OperationalError (ctx): %s", exc)
-        raise AppException(
-            ErrorType.SYS_500_INTERNAL_ERROR,
-            MessageCode.INTERNAL_ERROR,
-            status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"MySQL error: {exc}",
-        ) from exc
-    except Exception as exc:
-        logger.exception("Unexpected MySQL session error (ctx): %s", exc)
-        raise
-    finally:
-        db.close()
+    async with get_session_maker()() as db:
+        try:
+            yield db
+        except OperationalError as exc:
+            logger.exception("MySQL OperationalError (ctx): %s", exc)
+            await db.rollback()
+            raise AppException(
+                ErrorType.SYS_500_INTERNAL_ERROR,
+                MessageCode.INTERNAL_ERROR,
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"MySQL error: {exc}",
+            ) from exc
+        except Exception as exc:
+            logger.exception("Unexpected MySQL session error (ctx): %s", exc)
+            await db.rollback()
+            raise
+
+
+# =====================================================
+# READ REPLICAS
+# =====================================================
+
+_replica_router: ReplicaRouter | None = None
+
+
+def get_replica_router() -> ReplicaRouter | None:
+    global _replica_router
+
+    if _replica_router is None and CONFIG_SETTINGS.MYSQL_REPLICA_URLS:
+        _replica_router = ReplicaRouter(
+            "mysql",
+            CONFIG_SETTINGS.MYSQL_REPLICA_URLS,
+            _create_engine,
+            CONFIG_SETTINGS.REPLICA_COOLDOWN_SECONDS,
+        )
+    return _replica_router
+
+
+@asynccontextmanager
+async def get_ctx_mysql_read_db(
+    sticky_key: str | None = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Read-only work: a replica session, or the primary as fallback."""
+    async with read_session(get_replica_router(), get_session_maker(), sticky_key) as session:
+        yield session
+
+
+async def get_mysql_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with get_ctx_mysql_read_db(sticky_key_from_request(request)) as session:
+        yield session
+
+
+def get_pool_stats() -> dict:
+    """Pool telemetry; empty until the engine has been created."""
+    return pool_stats(_engine)
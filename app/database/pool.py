@@ -0,0 +1,116 @@
+"""Shared SQLAlchemy pool class with checkout telemetry for the SQL engines."""
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+@dataclass
+class PoolMetrics:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+    overflow_max: int = 0
+    connects: int = 0
+    invalidations: int = 0
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that times every checkout.
+
+    The wait covers queueing for a free connection and, when the pool grows
+    into overflow, opening the new one. Timeouts (pool exhausted for
+    `pool_timeout` seconds) are counted separately and only feed the max
+    wait, not the average. Metrics survive
+    `recreate()` (engine.dispose()).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            waited_ms = (time.perf_counter() - started) * 1000
+            self.metrics.wait_ms_max = max(self.metrics.wait_ms_max, waited_ms)
+
+        self.metrics.checkouts += 1
+        self.metrics.wait_ms_total += waited_ms
+        self.metrics.overflow_max = max(self.metrics.overflow_max, self.overflow())
+        return entry
+
+
+def pool_options(
+    size: int, max_overflow: int, timeout: float, recycle: int, pre_ping: bool
+) -> dict[str, Any]:
+    """`create_async_engine` keyword arguments for one database's pool settings."""
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": size,
+        "max_overflow": max_overflow,
+        "pool_timeout": timeout,
+        "pool_recycle": recycle,
+        "pool_pre_ping": pre_ping,
+    }
+
+
+def attach_pool_events(engine: AsyncEngine) -> None:
+    """Count physical connects and invalidated (dropped/stale) connections."""
+    metrics = engine.sync_engine.pool.metrics
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+
+    @event.listens_for(engine.sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
+
+def pool_stats(engine: AsyncEngine | None) -> dict[str, Any]:
+    if engine is None:
+        return {}
+
+    pool = engine.sync_engine.pool
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    stats: dict[str, Any] = {
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        # QueuePool.overflow() starts at -pool_size; only positive values are overflow
+        "overflow": max(pool.overflow(), 0),
+        "utilization": round(pool.checkedout() / capacity, 4) if capacity else 0.0,
+    }
+
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(
+            overflow_max=metrics.overflow_max,
+            checkouts=metrics.checkouts,
+            timeouts=metrics.timeouts,
+            wait_ms_avg=round(metrics.wait_ms_total / metrics.checkouts, 3)
+            if metrics.checkouts
+            else 0.0,
+            wait_ms_max=round(metrics.wait_ms_max, 3),
+            connects=metrics.connects,
+            invalidations=metrics.invalidations,
+        )
+    return stats
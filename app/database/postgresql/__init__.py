@@ -1 +1 @@
-from .session import create_tables, get_postgres_db
+from .session import create_tables, get_ctx_postgres_read_db, get_postgres_db, get_postgres_read_db
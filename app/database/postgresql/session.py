@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from typing import AsyncGenerator, List
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, List
 
 import asyncpg
+from fastapi import Request
 from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -15,10 +18,16 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.config import settings as CONFIG_SETTINGS
+from app.database.instrumentation import instrument_engine
+from app.database.pool import attach_pool_events, pool_options, pool_stats
 from app.database.postgresql.base import PostgresBase
+from app.database.replicas import ReplicaRouter, read_session, sticky_key_from_request
+
+PGBOUNCER_MODES = ("off", "transaction", "legacy")
 
 _engine: AsyncEngine | None = None
 _session_maker: async_sessionmaker[AsyncSession] | None = None
+_replica_router: ReplicaRouter | None = None
 
 
 def get_database_url() -> str:
@@ -33,16 +42,62 @@ def get_database_url() -> str:
     return connection
 
 
+def _unique_statement_name() -> str:
+    # Server connections are shared through the pooler, so asyncpg's
+    # per-connection counters ("__asyncpg_stmt_1__") would collide
+    return f"__asyncpg_{uuid.uuid4().hex}__"
+
+
+def statement_cache_options(
+    statement_cache_size: int, query_cache_size: int, pgbouncer_mode: str
+) -> dict[str, Any]:
+    """`create_async_engine` keyword arguments controlling statement reuse."""
+    if pgbouncer_mode not in PGBOUNCER_MODES:
+        msg = f"POSTGRES_PGBOUNCER_MODE must be one of {PGBOUNCER_MODES}"
+        raise ValueError(msg)
+
+    connect_args: dict[str, Any] = {
+        "prepared_statement_cache_size": statement_cache_size,
+    }
+    if pgbouncer_mode != "off":
+        connect_args["prepared_statement_name_func"] = _unique_statement_name
+        # asyncpg's own cache (used for introspection) cannot follow the pooler
+        connect_args["statement_cache_size"] = 0
+    if pgbouncer_mode == "legacy":
+        connect_args["prepared_statement_cache_size"] = 0
+
+    return {"query_cache_size": query_cache_size, "connect_args": connect_args}
+
+
+def _create_engine(url: str, echo: bool = False) -> AsyncEngine:
+    """Engine with the configured pool and statement-cache policy."""
+    engine = create_async_engine(
+        url,
+        echo=echo,
+        **pool_options(
+            size=CONFIG_SETTINGS.POSTGRES_POOL_SIZE,
+            max_overflow=CONFIG_SETTINGS.POSTGRES_MAX_OVERFLOW,
+            timeout=CONFIG_SETTINGS.POSTGRES_POOL_TIMEOUT,
+            recycle=CONFIG_SETTINGS.POSTGRES_POOL_RECYCLE,
+            pre_ping=CONFIG_SETTINGS.POSTGRES_POOL_PRE_PING,
+        ),
+        **statement_cache_options(
+            statement_cache_size=CONFIG_SETTINGS.POSTGRES_STATEMENT_CACHE_SIZE,
+            query_cache_size=CONFIG_SETTINGS.POSTGRES_QUERY_CACHE_SIZE,
+            pgbouncer_mode=CONFIG_SETTINGS.POSTGRES_PGBOUNCER_MODE,
+        ),
+    )
+    attach_pool_events(engine)
+    instrument_engine(engine)
+    return engine
+
+
 def init_engine(echo: bool = False) -> AsyncEngine:
     global _engine, _session_maker
 
     if _engine is None:
         try:
-            _engine = create_async_engine(
-                get_database_url(),
-                echo=echo,
-                pool_pre_ping=True,
-            )
+            _engine = _create_engine(get_database_url(), echo=echo)
             _session_maker = async_sessionmaker(_engine, expire_on_commit=False)
         except Exception as exc:
             # Import AppException and related enums locally to avoid circular imports
@@ -93,12 +148,59 @@ async def get_postgres_db() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+# =====================================================
+# READ REPLICAS
+# =====================================================
+
+
+def get_replica_router() -> ReplicaRouter | None:
+    global _replica_router
+
+    if _replica_router is None and CONFIG_SETTINGS.POSTGRES_REPLICA_URLS:
+        _replica_router = ReplicaRouter(
+            "postgres",
+            CONFIG_SETTINGS.POSTGRES_REPLICA_URLS,
+            _create_engine,
+            CONFIG_SETTINGS.REPLICA_COOLDOWN_SECONDS,
+        )
+    return _replica_router
+
+
+@asynccontextmanager
+async def get_ctx_postgres_read_db(
+    sticky_key: str | None = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Read-only work: a replica session, or the primary as fallback."""
+    async with read_session(get_replica_router(), get_session_maker(), sticky_key) as session:
+        yield session
+
+
+async def get_postgres_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with get_ctx_postgres_read_db(sticky_key_from_request(request)) as session:
+        yield session
+
+
 def get_engine() -> AsyncEngine:
     if _engine is None:
         return init_engine()
     return _engine
 
 
+async def dispose_engine() -> None:
+    """Close pooled connections; the next use creates a fresh engine."""
+    global _engine, _session_maker
+
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+        _session_maker = None
+
+
+def get_pool_stats() -> dict:
+    """Pool telemetry; empty until the engine has been created."""
+    return pool_stats(_engine)
+
+
 # =====================================================
 # CREATE TABLES
 # =====================================================
@@ -0,0 +1 @@
+from .client import close_redis, get_redis, init_redis, redis_health, redis_pool_stats
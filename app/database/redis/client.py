@@ -0,0 +1,153 @@
+"""Process-wide Redis client, created and closed by the app lifespan."""
+
+import asyncio
+import time
+
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.connection import (
+    Connection,
+    SSLConnection,
+    UnixDomainSocketConnection,
+)
+
+from app.config import settings as CONFIG_SETTINGS
+from app.core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """Blocking pool (waits up to `timeout` for a free connection) that
+    records how long checkouts wait."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.checkouts = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    async def get_connection(self, command_name, *keys, **options):
+        started = time.perf_counter()
+        connection = await super().get_connection(command_name, *keys, **options)
+        waited_ms = (time.perf_counter() - started) * 1000
+
+        self.checkouts += 1
+        self.wait_ms_total += waited_ms
+        self.wait_ms_max = max(self.wait_ms_max, waited_ms)
+        return connection
+
+    def stats(self) -> dict:
+        in_use = len(self._in_use_connections)
+        return {
+            "max_connections": self.max_connections,
+            "in_use": in_use,
+            "idle": len(self._available_connections),
+            "utilization": round(in_use / self.max_connections, 4),
+            "checkouts": self.checkouts,
+            "wait_ms_avg": round(self.wait_ms_total / self.checkouts, 3)
+            if self.checkouts
+            else 0.0,
+            "wait_ms_max": round(self.wait_ms_max, 3),
+        }
+
+
+_client: Redis | None = None
+
+
+def build_connection_pool() -> InstrumentedConnectionPool:
+    options = {
+        "db": CONFIG_SETTINGS.REDIS_DB,
+        "password": CONFIG_SETTINGS.REDIS_PASS or None,
+        "decode_responses": True,
+        "max_connections": CONFIG_SETTINGS.REDIS_MAX_CONNECTIONS,
+        "timeout": CONFIG_SETTINGS.REDIS_POOL_TIMEOUT,
+        "socket_timeout": CONFIG_SETTINGS.REDIS_SOCKET_TIMEOUT,
+        "socket_connect_timeout": CONFIG_SETTINGS.REDIS_SOCKET_CONNECT_TIMEOUT,
+        "health_check_interval": CONFIG_SETTINGS.REDIS_HEALTH_CHECK_INTERVAL,
+    }
+
+    if CONFIG_SETTINGS.REDIS_UNIX_SOCKET:
+        options.update(
+            connection_class=UnixDomainSocketConnection,
+            path=CONFIG_SETTINGS.REDIS_UNIX_SOCKET,
+        )
+    else:
+        options.update(host=CONFIG_SETTINGS.REDIS_DB_HOST, port=CONFIG_SETTINGS.REDIS_PORT)
+        if CONFIG_SETTINGS.REDIS_SSL or CONFIG_SETTINGS.SSL_CA_CERTS:
+            options.update(
+                connection_class=SSLConnection,
+                ssl_ca_certs=CONFIG_SETTINGS.SSL_CA_CERTS,
+                ssl_cert_reqs="required",
+            )
+        else:
+            options.update(connection_class=Connection)
+
+    return InstrumentedConnectionPool(**options)
+
+
+async def init_redis() -> Redis:
+    """Create the client and open `REDIS_POOL_WARMUP` connections up front."""
+    global _client
+    if _client is not None:
+        return _client
+
+    pool = build_connection_pool()
+    _client = Redis(connection_pool=pool)
+
+    warmup = min(CONFIG_SETTINGS.REDIS_POOL_WARMUP, pool.max_connections)
+    if warmup:
+        # Hold N connections at once so N distinct sockets get opened
+        results = await asyncio.gather(
+            *(pool.get_connection("PING") for _ in range(warmup)),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for result in results:
+            if not isinstance(result, BaseException):
+                await pool.release(result)
+
+        if errors:
+            # Not fatal: callers degrade per feature and the pool reconnects
+            logger.warning("Redis warm-up failed: %s", errors[0])
+        else:
+            logger.info("Redis pool warmed with %d connections", warmup)
+
+    return _client
+
+
+def get_redis() -> Redis:
+    if _client is None:
+        msg = "Redis client is not initialized"
+        raise RuntimeError(msg)
+    return _client
+
+
+async def close_redis() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose(close_connection_pool=True)
+        _client = None
+        logger.info("Redis connection pool closed")
+
+
+def redis_pool_stats() -> dict:
+    if _client is None:
+        return {}
+    return _client.connection_pool.stats()
+
+
+async def redis_health() -> dict:
+    """PING round trip plus pool utilization."""
+    started = time.perf_counter()
+    try:
+        await get_redis().ping()
+        status = "ok"
+    except Exception as exc:
+        logger.warning("Redis health check failed: %s", exc)
+        status = "unavailable"
+
+    return {
+        "status": status,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 3),
+        "pool": redis_pool_stats(),
+    }
@@ -0,0 +1,204 @@
+"""Read-replica routing and read-your-writes stickiness for the SQL engines."""
+
+import itertools
+import time
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+import jwt
+from fastapi import Request
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.config import settings as CONFIG_SETTINGS
+from app.core.cache.ttl_cache import TTLCache
+from app.core.logging.logger import get_logger
+from app.database.pool import pool_stats
+from app.database.redis import get_redis
+
+logger = get_logger(__name__)
+
+
+class Replica:
+    def __init__(self, url: str, engine: AsyncEngine):
+        self.url = make_url(url).render_as_string(hide_password=True)
+        self.engine = engine
+        self.session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        self.down_until = 0.0
+        self.failures = 0
+        self.reads = 0
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.down_until
+
+
+class ReplicaRouter:
+    """
+    Round robin over a database's replicas, skipping unhealthy ones.
+
+    A replica whose connection fails is taken out of rotation for
+    `cooldown_seconds` and then tried again; when none is healthy, reads go
+    to the primary.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        urls: list[str],
+        engine_factory: Callable[[str], AsyncEngine],
+        cooldown_seconds: float,
+    ):
+        self.name = name
+        self.replicas = [Replica(url, engine_factory(url)) for url in urls]
+        self.cooldown_seconds = cooldown_seconds
+        self.primary_reads = 0
+        self._turn = itertools.count()
+
+    def candidates(self) -> list[Replica]:
+        """Healthy replicas, starting with the one whose turn it is."""
+        if not self.replicas:
+            return []
+        start = next(self._turn) % len(self.replicas)
+        ordered = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in ordered if replica.healthy]
+
+    def mark_down(self, replica: Replica, exc: Exception) -> None:
+        replica.failures += 1
+        replica.down_until = time.monotonic() + self.cooldown_seconds
+        logger.warning(
+            "%s replica %s unavailable for %ss: %s",
+            self.name,
+            replica.url,
+            self.cooldown_seconds,
+            exc,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "primary_reads": self.primary_reads,
+            "replicas": [
+                {
+                    "url": replica.url,
+                    "healthy": replica.healthy,
+                    "reads": replica.reads,
+                    "failures": replica.failures,
+                    "pool": pool_stats(replica.engine),
+                }
+                for replica in self.replicas
+            ],
+        }
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+# ============================================================
+# READ-YOUR-WRITES
+# ============================================================
+
+class ReadYourWrites:
+    """
+    Remembers principals whose rows were written in the last
+    `READ_YOUR_WRITES_SECONDS`, so their reads stay on the primary until the
+    replicas have caught up.
+
+    Marks live in Redis (shared by every worker) with a per-worker copy for
+    the writing worker itself. If Redis cannot be asked, reads go to the
+    primary.
+    """
+
+    def __init__(self):
+        self.window_seconds = CONFIG_SETTINGS.READ_YOUR_WRITES_SECONDS
+        self.window_ms = int(self.window_seconds * 1000)
+        self._local = TTLCache(maxsize=10_000)
+
+    @staticmethod
+    def key(realm: str, principal_id: int | str) -> str:
+        return f"{realm}:{principal_id}"
+
+    async def mark(self, realm: str, *principal_ids: int | str) -> None:
+        if not self.window_ms or not principal_ids:
+            return
+
+        keys = [self.key(realm, principal_id) for principal_id in principal_ids]
+        for key in keys:
+            self._local.set(key, True, self.window_seconds)
+        try:
+            async with get_redis().pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(f"rw:{key}", 1, px=self.window_ms)
+                await pipe.execute()
+        except Exception as exc:
+            logger.warning("Read-your-writes mark not shared: %s", exc)
+
+    async def is_recent(self, key: str) -> bool:
+        if not self.window_ms:
+            return False
+        if self._local.get(key) is not None:
+            return True
+        try:
+            return bool(await get_redis().exists(f"rw:{key}"))
+        except Exception:
+            return True
+
+
+read_your_writes = ReadYourWrites()
+
+
+def sticky_key_from_request(request: Request) -> str | None:
+    """
+    Read-your-writes key of the caller, from the bearer token's claims.
+
+    The signature is not checked: this only decides where a read is served,
+    and the route's own auth dependency still verifies the token.
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+        realm = "admin" if claims.get("role") == "admin" else "user"
+        return read_your_writes.key(realm, claims["sub"])
+    except Exception:
+        return None
+
+
+@asynccontextmanager
+async def read_session(
+    router: ReplicaRouter | None,
+    primary_maker: async_sessionmaker[AsyncSession],
+    sticky_key: str | None = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Session on a healthy replica, or on the primary when none qualifies."""
+
+    session: AsyncSession | None = None
+
+    if router is not None and not (
+        sticky_key and await read_your_writes.is_recent(sticky_key)
+    ):
+        for replica in router.candidates():
+            candidate = replica.session_maker()
+            try:
+                await candidate.connection()  # checkout + pre-ping
+            except Exception as exc:
+                await candidate.close()
+                router.mark_down(replica, exc)
+                continue
+            replica.reads += 1
+            session = candidate
+            break
+
+    if session is None:
+        if router is not None:
+            router.primary_reads += 1
+        session = primary_maker()
+
+    async with session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
@@ -0,0 +1,137 @@
+"""Startup phase that opens pooled connections to every backing store."""
+
+import asyncio
+import time
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings as CONFIG_SETTINGS
+from app.core.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+async def _warm_sql(engine: AsyncEngine, count: int) -> int:
+    # Hold all N at once so N distinct connections are opened; capped at
+    # pool_size because overflow connections are discarded on check-in
+    count = min(count, engine.sync_engine.pool.size())
+    async with AsyncExitStack() as stack:
+        connections = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(count))
+        )
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in connections))
+    return count
+
+
+async def warm_postgres(count: int) -> int:
+    from app.database.postgresql.session import get_engine
+
+    return await _warm_sql(get_engine(), count)
+
+
+async def warm_mysql(count: int) -> int:
+    from app.database.mysql.session import get_engine
+
+    return await _warm_sql(get_engine(), count)
+
+
+async def warm_mongodb(count: int) -> int:
+    from app.database.mongodb.client import MongoDBSingleton
+
+    # Concurrent pings make Motor open up to N pooled sockets
+    client = MongoDBSingleton()._client
+    await asyncio.gather(*(client.admin.command("ping") for _ in range(count)))
+    return count
+
+
+async def warm_redis(count: int) -> int:
+    from app.database.redis import get_redis, init_redis
+
+    await init_redis()  # opens REDIS_POOL_WARMUP connections
+    await get_redis().ping()
+    return count
+
+
+class Readiness:
+    """
+    Tracks which stores have been warmed.
+
+    The lifespan awaits one round of warm-up (bounded by
+    `DB_WARMUP_TIMEOUT_SECONDS`); stores that failed are retried in the
+    background with backoff. `ready` only turns true once every enabled
+    store has been warmed.
+    """
+
+    def __init__(self):
+        # A warm-up count of 0 leaves that store out of readiness entirely
+        targets: dict[str, tuple[Callable[[int], Awaitable[int]], int]] = {
+            "postgres": (warm_postgres, CONFIG_SETTINGS.POSTGRES_POOL_WARMUP),
+            "mysql": (warm_mysql, CONFIG_SETTINGS.MYSQL_POOL_WARMUP),
+            "mongodb": (warm_mongodb, CONFIG_SETTINGS.MONGODB_POOL_WARMUP),
+            "redis": (warm_redis, CONFIG_SETTINGS.REDIS_POOL_WARMUP),
+        }
+        self.targets = {name: target for name, target in targets.items() if target[1] > 0}
+        self.results: dict[str, dict[str, Any]] = {}
+        self.retry_backoff = 1.0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.results.keys() == self.targets.keys() and all(
+            result["status"] == "ok" for result in self.results.values()
+        )
+
+    async def _warm(self, name: str) -> None:
+        warm, count = self.targets[name]
+        started = time.perf_counter()
+        try:
+            opened = await asyncio.wait_for(
+                warm(count), CONFIG_SETTINGS.DB_WARMUP_TIMEOUT_SECONDS
+            )
+            result = {"status": "ok", "connections": opened}
+        except Exception as exc:
+            logger.warning("Warm-up of %s failed: %r", name, exc)
+            result = {"status": "unavailable", "error": type(exc).__name__}
+
+        result["ms"] = round((time.perf_counter() - started) * 1000, 1)
+        self.results[name] = result
+
+    async def _retry_failed(self) -> None:
+        backoff = self.retry_backoff
+        while not self.ready:
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+            await asyncio.gather(
+                *(
+                    self._warm(name)
+                    for name, result in self.results.items()
+                    if result["status"] != "ok"
+                )
+            )
+        logger.info("All stores warmed; ready")
+
+    async def warm_up(self) -> None:
+        if not CONFIG_SETTINGS.DB_WARMUP_ENABLED:
+            self.results = {name: {"status": "ok", "connections": 0} for name in self.targets}
+            return
+
+        await asyncio.gather(*(self._warm(name) for name in self.targets))
+        logger.info("Warm-up finished: %s", self.results)
+
+        if not self.ready:
+            self._task = asyncio.create_task(self._retry_failed(), name="warmup-retry")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+readiness = Readiness()
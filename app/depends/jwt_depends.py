@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -6,21 +7,62 @@ import jwt
 from fastapi import Depends,status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from redis.asyncio import Redis
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
 from app.config import settings
+from app.core.cache.principal_cache import principal_cache
+from app.core.cache.token_cache import VerifiedTokenCache
 from app.core.error.error_types import ErrorType
 from app.core.error.message_codes import MessageCode
+from app.core.concurrency.executor import BoundedExecutor
 from app.core.middleware.exception_middleware import AppException
-from app.database.postgresql.session import get_postgres_db
-from app.database.mysql.session import get_mysql_db
-from app.models.postgresql.users import TblUser
-from app.models.mysql.admin import TblAdmin
+from app.core.security.keys import (
+    KeyRing,
+    init_worker_keyring,
+    worker_decode,
+    worker_encode,
+)
+from app.core.security.revocation import RevocationListener
+from app.database.postgresql.session import get_ctx_postgres_read_db
+from app.database.mysql.session import get_ctx_mysql_read_db
+from app.database.redis import get_redis
+from app.models.postgresql.users import TblUser, UsersBaseModel
+from app.models.mysql.admin import AdminBaseModel, TblAdmin
 
 
 security = HTTPBearer()
 
+# Deletes the token keys listed in a user's session index and announces them
+# on the revocation stream, in a single round trip. Index members are the
+# token keys themselves and each key stores its session id, so ARGV[3]
+# restricts the revocation to one session ("" revokes every session and
+# drops the index).
+REVOKE_SESSIONS_SCRIPT = """
+local entries = redis.call('ZRANGE', KEYS[1], 0, -1, 'WITHSCORES')
+local members = {}
+local revoked = {}
+for i = 1, #entries, 2 do
+    if ARGV[3] == '' or redis.call('GET', entries[i]) == ARGV[3] then
+        members[#members + 1] = entries[i]
+        revoked[#revoked + 1] = entries[i] .. '@' .. entries[i + 1]
+    end
+end
+for i = 1, #members, 500 do
+    local last = math.min(i + 499, #members)
+    redis.call('DEL', unpack(members, i, last))
+    redis.call('ZREM', KEYS[1], unpack(members, i, last))
+end
+if ARGV[3] == '' then
+    redis.call('DEL', KEYS[1])
+end
+if #members > 0 then
+    redis.call(
+        'XADD', KEYS[2], 'MINID', '~', ARGV[1], '*',
+        'sub', ARGV[2], 'sessions', table.concat(revoked, ',')
+    )
+end
+return members
+"""
+
 
 # ============================================================
 # JWT SERVICE
@@ -30,16 +72,28 @@ class JWTService:
 
     def __init__(self):
 
-        self.redis = Redis(
-            host=settings.REDIS_DB_HOST,
-            port=settings.REDIS_PORT,
-            db=settings.REDIS_DB,
-            password=settings.REDIS_PASS,
-            decode_responses=True,
+        self.keyring = KeyRing(
+            private_key_pem=settings.APP_JWT_PRIVATE_KEY,
+            public_key_pem=settings.APP_JWT_PUBLIC_KEY,
+            algorithm=settings.APP_JWT_ALGORITHM,
+            key_id=settings.APP_JWT_KEY_ID,
+            verification_keys=settings.APP_JWT_VERIFICATION_KEYS,
         )
 
-        self.private_key = settings.APP_JWT_PRIVATE_KEY.replace("\\n", "\n")
-        self.public_key = settings.APP_JWT_PUBLIC_KEY.replace("\\n", "\n")
+        # Where signing/verification CPU work runs (inline / thread / process)
+        process_mode = settings.JWT_CRYPTO_EXECUTOR == "process"
+        self.crypto = BoundedExecutor(
+            "jwt-crypto",
+            mode=settings.JWT_CRYPTO_EXECUTOR,
+            max_workers=settings.JWT_CRYPTO_MAX_WORKERS,
+            max_in_flight=settings.JWT_CRYPTO_MAX_IN_FLIGHT,
+            initializer=init_worker_keyring if process_mode else None,
+            initargs=(self.keyring.config,) if process_mode else (),
+        )
+        if process_mode:
+            self._sign, self._verify = worker_encode, worker_decode
+        else:
+            self._sign, self._verify = self.keyring.encode, self.keyring.decode
 
         self.issuer = settings.PROJECT_NAME
         self.audience = "api"
@@ -47,9 +101,59 @@ class JWTService:
         self.access_exp = settings.ACCESS_TOKEN_EXPIRE_MINUTES
         self.refresh_exp = settings.REFRESH_TOKEN_EXPIRE_MINUTES
 
+        # Per-principal session index: sorted set of "<type>:<jti>" scored by
+        # exp. Keyed by realm too, since user and admin ids overlap.
+        self.session_index_prefix = "sessions"
+        self._revoke_script = None
+
+        self.token_cache = VerifiedTokenCache(
+            maxsize=settings.TOKEN_CACHE_MAX_SIZE if settings.TOKEN_CACHE_ENABLED else 0,
+            revalidate_seconds=settings.TOKEN_CACHE_REVALIDATE_SECONDS,
+            subject_of=lambda payload: self._subject(
+                self.realm_for(payload["role"]), payload["sub"]
+            ),
+        )
+
+        # Local deny-list fed by the revocation stream. Cache hits are
+        # checked against it; stateless verify also trusts it instead of a
+        # Redis GET. Other workers' revocations never reach this cache otherwise.
+        self.revocation_stream = settings.JWT_REVOCATION_STREAM
+        self.stateless_verify = settings.JWT_STATELESS_VERIFY
+        self.revocations = (
+            RevocationListener(
+                stream_key=self.revocation_stream,
+                retention_seconds=self.refresh_exp * 60,
+                max_lag_seconds=settings.JWT_REVOCATION_MAX_LAG_SECONDS,
+            )
+            if settings.JWT_STATELESS_VERIFY or settings.TOKEN_CACHE_ENABLED
+            else None
+        )
+
+    # ================= REDIS =================
+
+    @property
+    def redis(self) -> Redis:
+        # Owned by the app lifespan (see app.database.redis)
+        return get_redis()
+
+    @property
+    def _revoke_sessions(self):
+        redis = self.redis
+        if self._revoke_script is None or self._revoke_script.registered_client is not redis:
+            self._revoke_script = redis.register_script(REVOKE_SESSIONS_SCRIPT)
+        return self._revoke_script
 
     # ================= INTERNAL =================
 
+    @staticmethod
+    def realm_for(role: str) -> str:
+        """"admin" for admin tokens (MySQL ids), "user" otherwise (Postgres ids)."""
+        return "admin" if role == "admin" else "user"
+
+    @staticmethod
+    def _subject(realm: str, user_id: int | str) -> str:
+        return f"{realm}:{user_id}"
+
     def _now(self):
         return datetime.now(timezone.utc)
 
@@ -59,6 +163,7 @@ class JWTService:
         role: str,
         expire_minutes: int,
         token_type: str,
+        session_id: str | None = None,
     ) -> dict[str, Any]:
 
         jti = uuid.uuid4().hex
@@ -73,8 +178,45 @@ class JWTService:
             "iat": int(self._now().timestamp()),
             "exp": int(expire.timestamp()),
             "jti": jti,
+            "sid": session_id or jti,  # Shared by tokens issued as a pair
         }
 
+    async def _encode(self, payload: dict[str, Any]) -> str:
+        return await self.crypto.run(self._sign, payload)
+
+    async def _decode(self, token: str) -> dict[str, Any]:
+        return await self.crypto.run(self._verify, token, self.issuer, self.audience)
+
+    def _session_index_key(self, realm: str, user_id: int | str) -> str:
+        return f"{self.session_index_prefix}:{self._subject(realm, user_id)}"
+
+    def _payload_index_key(self, payload: dict[str, Any]) -> str:
+        return self._session_index_key(self.realm_for(payload["role"]), payload["sub"])
+
+    def _index_sessions(self, pipe, *payloads: dict[str, Any]):
+        """Queue token keys of one user and their session-index entries."""
+        index_key = self._payload_index_key(payloads[0])
+        now = int(self._now().timestamp())
+
+        members = {}
+        for payload in payloads:
+            member = f"{payload['type']}:{payload['jti']}"
+            pipe.setex(member, payload["exp"] - now, payload["sid"])
+            members[member] = payload["exp"]
+
+        pipe.zadd(index_key, members)
+        # Drop entries whose tokens have already expired
+        pipe.zremrangebyscore(index_key, "-inf", now)
+        # The index lives as long as the longest-lived token it can hold
+        pipe.expire(index_key, self.refresh_exp * 60)
+
+    async def _store_sessions(self, *payloads: dict[str, Any], retired: tuple = ()):
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if retired:
+                pipe.zrem(self._payload_index_key(payloads[0]), *retired)
+            self._index_sessions(pipe, *payloads)
+            await pipe.execute()
+
 
     # ================= CREATE ACCESS =================
 
@@ -87,13 +229,8 @@ class JWTService:
             token_type="access",
         )
 
-        token = jwt.encode(payload, self.private_key, algorithm="RS256")
-
-        await self.redis.setex(
-            f"access:{payload['jti']}",
-            self.access_exp * 60,
-            payload["sub"],
-        )
+        token = await self._encode(payload)
+        await self._store_sessions(payload)
 
         return token
 
@@ -109,29 +246,95 @@ class JWTService:
             token_type="refresh",
         )
 
-        token = jwt.encode(payload, self.private_key, algorithm="RS256")
+        token = await self._encode(payload)
+        await self._store_sessions(payload)
+
+        return token
+
 
-        await self.redis.setex(
-            f"refresh:{payload['jti']}",
-            self.refresh_exp * 60,
-            payload["sub"],
+    # ================= CREATE PAIR =================
+
+    async def issue_token_pair(
+        self,
+        user_id: int,
+        role: str,
+        retired: tuple = (),
+        session_id: str | None = None,
+    ) -> tuple[str, str]:
+        """Mint an access/refresh pair and store both in one MULTI round trip."""
+
+        session_id = session_id or uuid.uuid4().hex
+        access_payload = self._generate_payload(
+            user_id=user_id,
+            role=role,
+            expire_minutes=self.access_exp,
+            token_type="access",
+            session_id=session_id,
+        )
+        refresh_payload = self._generate_payload(
+            user_id=user_id,
+            role=role,
+            expire_minutes=self.refresh_exp,
+            token_type="refresh",
+            session_id=session_id,
         )
 
-        return token
+        access_token, refresh_token = await asyncio.gather(
+            self._encode(access_payload), self._encode(refresh_payload)
+        )
+        await self._store_sessions(access_payload, refresh_payload, retired=retired)
+
+        return access_token, refresh_token
+
+
+    # ================= ROTATE =================
+
+    async def rotate_token_pair(self, refresh_payload: dict[str, Any]) -> tuple[str, str]:
+        """
+        Exchange a verified refresh token for a new pair.
+
+        Deleting the old refresh key is the atomic step: only one caller can
+        see DEL return 1, so a refresh token is redeemable exactly once.
+
+        The new pair keeps the session id, so the access token issued before
+        the refresh (valid until its own exp) is still revoked by logout.
+        """
+
+        member = f"refresh:{refresh_payload['jti']}"
+        if not await self.redis.delete(member):
+            raise AppException(
+                ErrorType.AUTH_401_SESSION_INVALID,
+                MessageCode.SESSION_INVALID,status.HTTP_401_UNAUTHORIZED
+            )
+
+        return await self.issue_token_pair(
+            user_id=int(refresh_payload["sub"]),
+            role=refresh_payload["role"],
+            retired=(member,),
+            session_id=refresh_payload.get("sid") or refresh_payload["jti"],
+        )
 
 
     # ================= VERIFY =================
 
     async def verify_token(self, token: str, expected_type: str):
 
+        # Cache hits need an up-to-date deny-list; a lagging listener means
+        # revocations from other workers may be missing, so verify fully
+        cached = self.token_cache.get_payload(token)
+        if (
+            cached is not None
+            and cached.get("type") == expected_type
+            and self.revocations is not None
+            and self.revocations.is_fresh()
+            and not self.revocations.is_revoked(cached["jti"])
+        ):
+            return cached
+        if cached is not None:
+            self.token_cache.reject()
+
         try:
-            payload = jwt.decode(
-                token,
-                self.public_key,
-                algorithms=["RS256"],
-                issuer=self.issuer,
-                audience=self.audience,
-            )
+            payload = await self._decode(token)
 
         except jwt.ExpiredSignatureError:
             raise AppException(
@@ -152,9 +355,16 @@ class JWTService:
                 MessageCode.INVALID_CREDENTIALS,status.HTTP_401_UNAUTHORIZED
             )
 
-        # Check Redis session
-        redis_key = f"{expected_type}:{payload['jti']}"
-        stored = await self.redis.get(redis_key)
+        # Check revocation: local deny-list while it is fresh, Redis otherwise
+        if (
+            self.stateless_verify
+            and self.revocations is not None
+            and self.revocations.is_fresh()
+        ):
+            stored = not self.revocations.is_revoked(payload["jti"])
+        else:
+            redis_key = f"{expected_type}:{payload['jti']}"
+            stored = await self.redis.get(redis_key)
 
         if not stored:
             raise AppException(
@@ -162,39 +372,205 @@ class JWTService:
                 MessageCode.UNAUTHORIZED_ACCESS,status.HTTP_401_UNAUTHORIZED
             )
 
+        self.token_cache.put_payload(token, payload)
         return payload
 
 
+    # ================= SESSIONS =================
+
+    async def list_user_sessions(self, realm: str, user_id: int) -> list[dict[str, Any]]:
+        """Return the live sessions of a user, one entry per session id."""
+
+        now = int(self._now().timestamp())
+        entries = await self.redis.zrangebyscore(
+            self._session_index_key(realm, user_id), now, "+inf", withscores=True
+        )
+        if not entries:
+            return []
+
+        session_ids = await self.redis.mget([member for member, _ in entries])
+
+        sessions: dict[str, dict[str, Any]] = {}
+        for (member, expires_at), session_id in zip(entries, session_ids):
+            if session_id is None:
+                continue
+            token_type, _, jti = member.partition(":")
+            session = sessions.setdefault(session_id, {"session_id": session_id})
+            session[f"{token_type}_jti"] = jti
+            session[f"{token_type}_expires_at"] = int(expires_at)
+        return list(sessions.values())
+
+    async def prune_user_sessions(self, realm: str, user_id: int) -> int:
+        """Remove index entries whose tokens have expired."""
+
+        return await self.redis.zremrangebyscore(
+            self._session_index_key(realm, user_id),
+            "-inf",
+            int(self._now().timestamp()),
+        )
+
     # ================= LOGOUT =================
 
-    async def revoke_user(self, user_id: int):
+    async def _revoke(self, realm: str, user_id: int, session_id: str = "") -> list[str]:
+
+        self.token_cache.invalidate_subject(self._subject(realm, user_id))
 
-        keys = await self.redis.keys("*")
+        # Trim stream entries older than the longest token lifetime
+        min_id = int((self._now().timestamp() - self.refresh_exp * 60) * 1000)
+        members = await self._revoke_sessions(
+            keys=[self._session_index_key(realm, user_id), self.revocation_stream],
+            args=[min_id, self._subject(realm, user_id), session_id],
+        )
+
+        if self.revocations is not None:
+            expires_at = int(self._now().timestamp()) + self.refresh_exp * 60
+            self.revocations.deny(",".join(f"{m}@{expires_at}" for m in members))
+
+        return members
+
+    async def revoke_session(self, realm: str, user_id: int, session_id: str) -> list[str]:
+        """Revoke every token of one session (an access/refresh pair)."""
+
+        return await self._revoke(realm, user_id, session_id)
+
+    async def revoke_user(self, realm: str, user_id: int) -> list[str]:
 
-        for key in keys:
-            value = await self.redis.get(key)
-            if value == str(user_id):
-                await self.redis.delete(key)
+        members = await self._revoke(realm, user_id)
+        await principal_cache.invalidate(realm, user_id)
+        return members
 
 
 jwt_service = JWTService()
 
 
+# ============================================================
+# PRINCIPAL LOADERS (cache first, then database)
+# ============================================================
+
+async def load_user(user_id: int) -> UsersBaseModel | None:
+
+    snapshot = await principal_cache.get("user", user_id)
+
+    if snapshot is None:
+        # Replica read; stays on the primary right after this user's writes
+        async with get_ctx_postgres_read_db(f"user:{user_id}") as db:
+            user = await TblUser.get_by_id(db, user_id)
+        if not user:
+            return None
+        snapshot = UsersBaseModel.model_validate(user).model_dump(
+            exclude={"hashed_password"}
+        )
+        await principal_cache.set("user", user_id, snapshot)
+
+    return UsersBaseModel(**snapshot)
+
+
+async def load_admin(admin_id: int) -> AdminBaseModel | None:
+
+    snapshot = await principal_cache.get("admin", admin_id)
+
+    if snapshot is None:
+        async with get_ctx_mysql_read_db(f"admin:{admin_id}") as db:
+            admin = await TblAdmin.get_by_id(db, admin_id)
+        if not admin:
+            return None
+        snapshot = AdminBaseModel.model_validate(admin).model_dump(
+            exclude={"hashed_password"}
+        )
+        await principal_cache.set("admin", admin_id, snapshot)
+
+    return AdminBaseModel(**snapshot)
+
+
+# ============================================================
+# CLAIMS PRINCIPAL (no database access)
+# ============================================================
+
+class ClaimsPrincipal:
+    """
+    Identity taken straight from a verified access token.
+
+    `id`, `role` and `session_id` are available immediately. The full
+    user/admin record is fetched on the first `await principal.load()`;
+    afterwards its other attributes can be read from the principal itself.
+    """
+
+    def __init__(self, payload: dict[str, Any]):
+        self.claims = payload
+        self.id = int(payload["sub"])
+        self.role = payload["role"]
+        # Tokens minted before session ids existed are their own session;
+        # never None or "" (which would revoke every session)
+        self.session_id = payload.get("sid") or payload["jti"]
+        self._record: UsersBaseModel | AdminBaseModel | None = None
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role == "admin"
+
+    @property
+    def realm(self) -> str:
+        return JWTService.realm_for(self.role)
+
+    async def load(self) -> UsersBaseModel | AdminBaseModel:
+
+        if self._record is None:
+            if self.is_admin:
+                self._record = await load_admin(self.id)
+            else:
+                self._record = await load_user(self.id)
+
+            if self._record is None:
+                raise AppException(
+                    ErrorType.RES_404_USER_NOT_FOUND,
+                    MessageCode.UNAUTHORIZED_ACCESS,status.HTTP_401_UNAUTHORIZED
+                )
+
+        return self._record
+
+    def __getattr__(self, name: str):
+        record = self.__dict__.get("_record")
+        if record is None:
+            raise AttributeError(
+                f"{name!r} is not a token claim; await principal.load() first"
+            )
+        return getattr(record, name)
+
+
+async def get_current_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> ClaimsPrincipal:
+
+    payload = await jwt_service.verify_token(credentials.credentials, "access")
+    return ClaimsPrincipal(payload)
+
+
+async def get_admin_claims(
+    principal: ClaimsPrincipal = Depends(get_current_claims),
+) -> ClaimsPrincipal:
+
+    if not principal.is_admin:
+        raise AppException(
+            ErrorType.AUTH_403_ACCESS_DENIED,
+            MessageCode.ACCESS_DENIED,
+            status.HTTP_403_FORBIDDEN,
+        )
+    return principal
+
+
 # ============================================================
 # USER DEPENDENCY (PostgreSQL)
 # ============================================================
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_postgres_db),
 ):
 
     token = credentials.credentials
 
     payload = await jwt_service.verify_token(token, "access")
 
-    user_id = int(payload["sub"])
-    user = await TblUser.get_by_id(db, user_id)
+    user = await load_user(int(payload["sub"]))
 
     if not user:
         raise AppException(
@@ -211,15 +587,13 @@ async def get_current_user(
 
 async def get_current_admin(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_mysql_db),
 ):
 
     token = credentials.credentials
 
     payload = await jwt_service.verify_token(token, "access")
 
-    admin_id = int(payload["sub"])
-    admin = await TblAdmin.get_by_id(db, admin_id)
+    admin = await load_admin(int(payload["sub"]))
 
     if not admin:
         raise AppException(
@@ -227,4 +601,4 @@ async def get_current_admin(
             MessageCode.UNAUTHORIZED_ACCESS,status.HTTP_401_UNAUTHORIZED
         )
 
-    return admin
\ No newline at end of file
+    return admin
@@ -1,9 +1,9 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.mysql.session import get_mysql_db
 
 
-def get_my_db() -> Session:
+async def get_my_db() -> AsyncSession:
     """Dependency for getting a MySQL database session."""
-    for session in get_mysql_db():
+    async for session in get_mysql_db():
         yield session
@@ -1,11 +1,14 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from strawberry.fastapi import GraphQLRouter
 
 from app.api import app_router
+from app.api.auth.service import AuthService
 from app.config import settings
 from app.core.middleware.exception_middleware import (
     AppException,
@@ -14,16 +17,46 @@ from app.core.middleware.exception_middleware import (
     http_exception_handler,
     validation_exception_handler,
 )
+from app.core.logging.logger import get_logger
 from app.core.middleware.logging_middleware import LoggingMiddleware
+from app.core.middleware.sql_stats_middleware import SQLStatsMiddleware
+from app.core.security.username_filter import username_filter
 from app.database.mongodb.client import MongoDBSingleton
+from app.database.mysql.session import dispose_engine as dispose_mysql_engine
+from app.database.mysql.session import get_replica_router as mysql_replicas
+from app.database.postgresql.session import dispose_engine as dispose_postgres_engine
+from app.database.postgresql.session import get_replica_router as postgres_replicas
+from app.database.redis import close_redis, init_redis, redis_health
+from app.database.warmup import readiness
+from app.depends.jwt_depends import jwt_service
 from app.graphql.context import get_graphql_context
 from app.graphql.schema import schema
+from app.utils.crypto_utils import (
+    bulk_password_executor,
+    calibrate_scrypt_params,
+    password_executor,
+    set_scrypt_params,
+    warm_dummy_password_hash,
+)
+
+logger = get_logger(__name__)
 
 # ==========================================
 # Startup / Shutdown Events
 # ==========================================
 
 
+async def _maintain_username_filters():
+    # Builds once, then rebuilds before the ready marker can lapse
+    while True:
+        try:
+            await AuthService.build_username_filters()
+        except Exception as exc:
+            # Filters stay "not ready", so logins fall back to the database
+            logger.warning("Username filter build failed: %s", exc)
+        await asyncio.sleep(username_filter.check_interval)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -31,10 +64,57 @@ async def lifespan(app: FastAPI):
     """
     # MongoDB Connect
     _ = MongoDBSingleton()
+
+    # Redis pool (sessions, revocation, caches, throttling)
+    await init_redis()
+
+    # Open pooled connections to every store before taking traffic
+    await readiness.warm_up()
+
+    # Password hashing cost tuned to this host
+    if settings.PASSWORD_CALIBRATE_ON_STARTUP:
+        set_scrypt_params(
+            await asyncio.to_thread(
+                calibrate_scrypt_params,
+                settings.PASSWORD_HASH_TARGET_MS,
+                settings.PASSWORD_SCRYPT_R,
+                settings.PASSWORD_SCRYPT_P,
+            )
+        )
+
+    # Revocation deny-list (token cache hits, stateless verification)
+    if jwt_service.revocations is not None:
+        jwt_service.revocations.start()
+
+    # Unknown-username logins verify against this; hash it off the loop now
+    await warm_dummy_password_hash()
+
+    # Known-username filters, kept fresh in the background (not ready = DB lookup)
+    filter_task = None
+    if settings.USERNAME_FILTER_ENABLED:
+        filter_task = asyncio.create_task(_maintain_username_filters())
+
     print("Application started successfully 🚀")
     yield
     print("Application shutting down...")
 
+    await readiness.stop()
+
+    if filter_task is not None:
+        filter_task.cancel()
+
+    if jwt_service.revocations is not None:
+        await jwt_service.revocations.stop()
+    jwt_service.crypto.shutdown()
+    password_executor.shutdown()
+    bulk_password_executor.shutdown()
+    for replicas in (postgres_replicas(), mysql_replicas()):
+        if replicas is not None:
+            await replicas.dispose()
+    await dispose_postgres_engine()
+    await dispose_mysql_engine()
+    await close_redis()
+
 
 # ==========================================
 # Create FastAPI App
@@ -72,6 +152,9 @@ app.add_middleware(
 
 app.add_middleware(LoggingMiddleware)
 
+if settings.SQL_INSTRUMENTATION_ENABLED:
+    app.add_middleware(SQLStatsMiddleware)
+
 
 # ==========================================
 # Exception Handlers
@@ -125,3 +208,19 @@ app.include_router(graphql_app, prefix="/graphql")
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "environment": settings.ENVIRONMENT}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    return JSONResponse(
+        status_code=200 if readiness.ready else 503,
+        content={
+            "status": "ready" if readiness.ready else "warming",
+            "stores": readiness.results,
+        },
+    )
+
+
+@app.get("/health/redis")
+async def redis_health_check():
+    return await redis_health()
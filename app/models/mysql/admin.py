@@ -1,6 +1,9 @@
 from pydantic import Field
-from sqlalchemy import Boolean, Integer, String, select
-from sqlalchemy.orm import Mapped, Session, mapped_column
+from sqlalchemy import Boolean, Integer, String, select, update
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.response.base_schema import CustomModel
 from app.database.mysql.base import MysqlBase
@@ -19,6 +22,11 @@ class AdminBaseModel(CustomModel):
     is_active: bool = True
 
 
+BULK_COLUMNS = {"username", "email", "role", "hashed_password", "is_active"}
+
+ER_DUP_ENTRY = 1062
+
+
 # ==============================
 # MySQL Admin Model
 # ==============================
@@ -65,41 +73,169 @@ class TblAdmin(MysqlBase):
     # CREATE
     # ----------------------------------
     @classmethod
-    async def create(cls, db: Session, user: AdminBaseModel):
+    async def create(cls, db: AsyncSession, user: AdminBaseModel):
         new_user = cls(**user.model_dump(exclude_unset=True))
         db.add(new_user)
-        db.flush()
+        await db.flush()
         return new_user
 
+    # ----------------------------------
+    # INSERT (single statement, conflict-aware)
+    # ----------------------------------
+    @classmethod
+    async def insert_if_absent(cls, db: AsyncSession, admin: AdminBaseModel) -> dict | None:
+        """
+        Plain INSERT; None when the username/email is taken.
+
+        ON DUPLICATE KEY UPDATE cannot tell a skipped row from an inserted
+        one here (the driver reports found rows), so the duplicate-key
+        error of the single INSERT is the conflict signal instead.
+        """
+        values = admin.model_dump(exclude_unset=True, exclude={"id"})
+        try:
+            result = await db.execute(insert(cls).values(**values))
+        except IntegrityError as exc:
+            if exc.orig.args and exc.orig.args[0] == ER_DUP_ENTRY:
+                return None
+            raise
+        return {"id": result.inserted_primary_key[0], **values}
+
+    # ----------------------------------
+    # BULK CREATE (multi-row INSERT)
+    # ----------------------------------
+    @classmethod
+    async def bulk_create(
+        cls, db: AsyncSession, admins: list[AdminBaseModel]
+    ) -> dict[str, int]:
+        """
+        Insert all rows in one multi-row INSERT, skipping existing usernames/emails.
+
+        MySQL has no RETURNING, so the created rows are read back by username
+        and told apart from pre-existing ones by their (salted, hence unique)
+        password hash. Usernames must be unique within `admins`.
+
+        Returns {username: id} for the rows created; any input username
+        missing from it was a duplicate.
+        """
+        if not admins:
+            return {}
+
+        rows = [admin.model_dump(include=BULK_COLUMNS) for admin in admins]
+
+        # No-op update instead of INSERT IGNORE, which would also hide data errors
+        await db.execute(
+            insert(cls).values(rows).on_duplicate_key_update(id=cls.id)
+        )
+
+        ours = {row["username"]: row["hashed_password"] for row in rows}
+        result = await db.execute(
+            select(cls.id, cls.username, cls.hashed_password).where(
+                cls.username.in_(ours)
+            )
+        )
+        return {
+            username: admin_id
+            for admin_id, username, hashed_password in result
+            if ours.get(username) == hashed_password
+        }
+
     # ----------------------------------
     # GET BY ID
     # ----------------------------------
     @classmethod
-    async def get_by_id(cls, db: Session, user_id: int):
-        result = db.execute(select(cls).where(cls.id == user_id))
+    async def get_by_id(cls, db: AsyncSession, user_id: int):
+        result = await db.execute(select(cls).where(cls.id == user_id))
         return result.scalar_one_or_none()
 
     # ----------------------------------
     # GET BY USERNAME
     # ----------------------------------
     @classmethod
-    async def get_by_username(cls, db: Session, username: str):
-        result = db.execute(select(cls).where(cls.username == username))
+    async def get_by_username(cls, db: AsyncSession, username: str):
+        result = await db.execute(select(cls).where(cls.username == username))
         return result.scalar_one_or_none()
 
+    # ----------------------------------
+    # ALL USERNAMES (streamed)
+    # ----------------------------------
+    @classmethod
+    async def iter_usernames(cls, db: AsyncSession, batch_size: int = 5000):
+        result = await db.stream_scalars(
+            select(cls.username).execution_options(yield_per=batch_size)
+        )
+        async for username in result:
+            yield username
+
+    # ----------------------------------
+    # LISTING (keyset on id)
+    # ----------------------------------
+    @classmethod
+    def _listing(cls, role: str | None = None, is_active: bool | None = None):
+        stmt = select(
+            cls.id, cls.username, cls.email, cls.role, cls.is_active
+        ).order_by(cls.id)
+        if role is not None:
+            stmt = stmt.where(cls.role == role)
+        if is_active is not None:
+            stmt = stmt.where(cls.is_active == is_active)
+        return stmt
+
+    @classmethod
+    async def list_page(
+        cls,
+        db: AsyncSession,
+        after_id: int | None = None,
+        limit: int = 50,
+        role: str | None = None,
+        is_active: bool | None = None,
+    ):
+        """Up to `limit` rows with id > `after_id`; cost does not grow with depth."""
+        stmt = cls._listing(role, is_active).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(cls.id > after_id)
+        result = await db.execute(stmt)
+        return result.mappings().all()
+
+    @classmethod
+    async def stream_listing(
+        cls,
+        db: AsyncSession,
+        role: str | None = None,
+        is_active: bool | None = None,
+        batch_size: int = 1000,
+    ):
+        """Every matching row in id order, server-side, one partition at a time."""
+        result = await db.stream(
+            cls._listing(role, is_active).execution_options(yield_per=batch_size)
+        )
+        async for partition in result.mappings().partitions():
+            yield partition
+
     # ----------------------------------
     # UPDATE
     # ----------------------------------
     @classmethod
-    async def update(cls, db: Session, user: AdminBaseModel):
+    async def update(cls, db: AsyncSession, user: AdminBaseModel) -> dict | None:
+        """
+        Single UPDATE; None when the id does not exist.
+
+        MySQL has no UPDATE ... RETURNING. The driver counts matched rather
+        than changed rows, so rowcount is a reliable existence check and
+        the id plus the values written are returned. Callers invalidate the
+        principal caches after committing (see AuthService._principal_changed).
+        """
         if not user.id:
             return None
-        existing_user = await cls.get_by_id(db, user.id)
-        if not existing_user:
+        values = user.model_dump(exclude_unset=True, exclude={"id"})
+        if not values:
+            return {"id": user.id} if await cls.get_by_id(db, user.id) else None
+
+        result = await db.execute(
+            update(cls)
+            .where(cls.id == user.id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
             return None
-
-        for key, value in user.model_dump(exclude_unset=True).items():
-            setattr(existing_user, key, value)
-
-        db.flush()
-        return existing_user
+        return {"id": user.id, **values}
@@ -1,8 +1,8 @@
 import uuid
 
 from pydantic import Field
-from sqlalchemy import Boolean, Integer, String, select
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Integer, String, select, text, update
+from sqlalchemy.dialects.postgresql import UUID, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -23,6 +23,9 @@ class UsersBaseModel(CustomModel):
     is_active: bool = True
 
 
+BULK_COLUMNS = ("username", "email", "role", "hashed_password", "is_active")
+
+
 # ==============================
 # PostgreSQL User Model
 # ==============================
@@ -73,6 +76,65 @@ class TblUser(PostgresBase):
         db.add(new_user)
         return new_user
 
+    # ----------------------------------
+    # INSERT (single statement, conflict-aware)
+    # ----------------------------------
+    @classmethod
+    async def insert_if_absent(
+        cls, db: AsyncSession, user: UsersBaseModel
+    ) -> dict | None:
+        """INSERT ... ON CONFLICT DO NOTHING RETURNING; None when username/email is taken."""
+        result = await db.execute(
+            insert(cls)
+            .values(**user.model_dump(exclude_unset=True, exclude={"id"}))
+            .on_conflict_do_nothing()
+            .returning(*cls._row())
+        )
+        row = result.mappings().one_or_none()
+        return dict(row) if row is not None else None
+
+    # ----------------------------------
+    # BULK CREATE (COPY + ON CONFLICT)
+    # ----------------------------------
+    @classmethod
+    async def bulk_create(
+        cls, db: AsyncSession, users: list[UsersBaseModel]
+    ) -> dict[str, int]:
+        """
+        COPY the rows into a temp table, then insert every row that does not
+        clash with an existing username/email in one statement.
+
+        Returns {username: id} for the rows created; any input username
+        missing from it was a duplicate.
+        """
+        if not users:
+            return {}
+
+        conn = await db.connection()
+        await conn.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {cls.__tablename__}_import "
+            f"ON COMMIT DROP AS SELECT {', '.join(BULK_COLUMNS)} "
+            f"FROM {cls.__tablename__} WITH NO DATA"
+        ))
+        await conn.execute(text(f"TRUNCATE {cls.__tablename__}_import"))
+
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            f"{cls.__tablename__}_import",
+            records=[
+                tuple(getattr(user, column) for column in BULK_COLUMNS)
+                for user in users
+            ],
+            columns=list(BULK_COLUMNS),
+        )
+
+        result = await conn.execute(text(
+            f"INSERT INTO {cls.__tablename__} ({', '.join(BULK_COLUMNS)}) "
+            f"SELECT {', '.join(BULK_COLUMNS)} FROM {cls.__tablename__}_import "
+            f"ON CONFLICT DO NOTHING RETURNING id, username"
+        ))
+        return {username: user_id for user_id, username in result}
+
     # ----------------------------------
     # GET BY ID
     # ----------------------------------
@@ -89,19 +151,88 @@ class TblUser(PostgresBase):
         result = await db.execute(select(cls).where(cls.username == username))
         return result.scalar_one_or_none()
 
+    # ----------------------------------
+    # ALL USERNAMES (streamed)
+    # ----------------------------------
+    @classmethod
+    async def iter_usernames(cls, db: AsyncSession, batch_size: int = 5000):
+        result = await db.stream_scalars(
+            select(cls.username).execution_options(yield_per=batch_size)
+        )
+        async for username in result:
+            yield username
+
+    # ----------------------------------
+    # LISTING (keyset on id)
+    # ----------------------------------
+    @classmethod
+    def _row(cls):
+        return cls.id, cls.username, cls.email, cls.role, cls.is_active
+
+    @classmethod
+    def _listing(cls, role: str | None = None, is_active: bool | None = None):
+        stmt = select(*cls._row()).order_by(cls.id)
+        if role is not None:
+            stmt = stmt.where(cls.role == role)
+        if is_active is not None:
+            stmt = stmt.where(cls.is_active == is_active)
+        return stmt
+
+    @classmethod
+    async def list_page(
+        cls,
+        db: AsyncSession,
+        after_id: int | None = None,
+        limit: int = 50,
+        role: str | None = None,
+        is_active: bool | None = None,
+    ):
+        """Up to `limit` rows with id > `after_id`; cost does not grow with depth."""
+        stmt = cls._listing(role, is_active).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(cls.id > after_id)
+        result = await db.execute(stmt)
+        return result.mappings().all()
+
+    @classmethod
+    async def stream_listing(
+        cls,
+        db: AsyncSession,
+        role: str | None = None,
+        is_active: bool | None = None,
+        batch_size: int = 1000,
+    ):
+        """Every matching row in id order, server-side, one partition at a time."""
+        result = await db.stream(
+            cls._listing(role, is_active).execution_options(yield_per=batch_size)
+        )
+        async for partition in result.mappings().partitions():
+            yield partition
+
     # ----------------------------------
     # UPDATE
     # ----------------------------------
     @classmethod
-    async def update(cls, db: AsyncSession, user: UsersBaseModel):
+    async def update(cls, db: AsyncSession, user: UsersBaseModel) -> dict | None:
+        """
+        UPDATE ... RETURNING in one round trip; the row as a plain dict (as
+        TblAdmin.update returns), None when the id does not exist.
+
+        Callers invalidate the principal caches after committing (see
+        AuthService._principal_changed), not before.
+        """
         if not user.id:
             return None
-        existing_user = await cls.get_by_id(db, user.id)
-        if not existing_user:
-            return None
-
-        for key, value in user.model_dump(exclude_unset=True).items():
-            setattr(existing_user, key, value)
-
-        await db.flush()
-        return existing_user
+        values = user.model_dump(exclude_unset=True, exclude={"id"})
+        if not values:
+            result = await db.execute(select(*cls._row()).where(cls.id == user.id))
+        else:
+            result = await db.execute(
+                update(cls)
+                .where(cls.id == user.id)
+                .values(**values)
+                .returning(*cls._row())
+                .execution_options(synchronize_session=False)
+            )
+        row = result.mappings().one_or_none()
+        return dict(row) if row is not None else None
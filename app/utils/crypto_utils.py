@@ -1,46 +1,287 @@
+import asyncio
 import os
 import base64
+import secrets
+import time
+from dataclasses import dataclass
+
 from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 from cryptography.hazmat.backends import default_backend
+from fastapi import status
 
+from app.config import settings
+from app.core.concurrency.executor import BoundedExecutor, ExecutorSaturatedError
+from app.core.error.error_types import ErrorType
+from app.core.error.message_codes import MessageCode
+from app.core.middleware.exception_middleware import AppException
 
-def hash_password(password: str) -> str:
-    """Securely hash password using Scrypt."""
+# Dedicated pool so KDF work never runs on the event loop
+password_executor = BoundedExecutor(
+    "password-hash",
+    mode=settings.PASSWORD_HASH_EXECUTOR,
+    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+    max_in_flight=settings.PASSWORD_HASH_MAX_IN_FLIGHT,
+    fail_fast=True,
+)
 
-    salt = os.urandom(16)  # ✅ random salt
+# Imports queue for a slot instead of failing, on a pool logins never share
+bulk_password_executor = BoundedExecutor(
+    "password-bulk",
+    mode=settings.PASSWORD_BULK_HASH_EXECUTOR,
+    max_workers=settings.PASSWORD_BULK_HASH_MAX_WORKERS,
+    max_in_flight=settings.PASSWORD_BULK_HASH_MAX_WORKERS * 2,
+)
 
-    kdf = Scrypt(
-        salt=salt,
-        length=32,
-        n=2**14,
-        r=8,
-        p=1,
-        backend=default_backend()
-    )
 
-    key = kdf.derive(password.encode())
+# ============================================================
+# HASH FORMAT
+# ============================================================
+# Current:  $scrypt$v=1$ln=<log2 N>,r=<r>,p=<p>$<salt b64>$<key b64>
+# Legacy:   base64(salt[16] + key[32]) with ln=14, r=8, p=1
 
-    return base64.b64encode(salt + key).decode()
+HASH_PREFIX = "$scrypt$v=1$"
+SALT_LENGTH = 16
+KEY_LENGTH = 32
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify password."""
+@dataclass(frozen=True)
+class ScryptParams:
+    log_n: int
+    r: int
+    p: int
+
+    def encode(self) -> str:
+        return f"ln={self.log_n},r={self.r},p={self.p}"
+
+    def weaker_than(self, other: "ScryptParams") -> bool:
+        """True when any cost dimension is below `other`'s."""
+        return self.log_n < other.log_n or self.r < other.r or self.p < other.p
+
+    @classmethod
+    def decode(cls, value: str) -> "ScryptParams":
+        fields = dict(item.split("=", 1) for item in value.split(","))
+        return cls(log_n=int(fields["ln"]), r=int(fields["r"]), p=int(fields["p"]))
+
+
+LEGACY_PARAMS = ScryptParams(log_n=14, r=8, p=1)
+
+_active_params = ScryptParams(
+    log_n=settings.PASSWORD_SCRYPT_LOG_N,
+    r=settings.PASSWORD_SCRYPT_R,
+    p=settings.PASSWORD_SCRYPT_P,
+)
+
+
+def get_scrypt_params() -> ScryptParams:
+    return _active_params
+
+
+def set_scrypt_params(params: ScryptParams) -> None:
+    global _active_params
+    _active_params = params
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
 
-    decoded = base64.b64decode(hashed_password)
-    salt = decoded[:16]
-    stored_key = decoded[16:]
 
-    kdf = Scrypt(
+def _parse_hash(hashed_password: str) -> tuple[ScryptParams, bytes, bytes]:
+    if not hashed_password.startswith(HASH_PREFIX):
+        decoded = base64.b64decode(hashed_password)
+        return LEGACY_PARAMS, decoded[:SALT_LENGTH], decoded[SALT_LENGTH:]
+
+    params, salt, key = hashed_password[len(HASH_PREFIX):].split("$")
+    return ScryptParams.decode(params), _b64decode(salt), _b64decode(key)
+
+
+def _kdf(salt: bytes, params: ScryptParams) -> Scrypt:
+    return Scrypt(
         salt=salt,
-        length=32,
-        n=2**14,
-        r=8,
-        p=1,
+        length=KEY_LENGTH,
+        n=2**params.log_n,
+        r=params.r,
+        p=params.p,
         backend=default_backend()
     )
 
+
+# ============================================================
+# HASH / VERIFY
+# ============================================================
+
+def hash_password(password: str, params: ScryptParams | None = None) -> str:
+    """Securely hash password using Scrypt."""
+
+    params = params or get_scrypt_params()
+    salt = os.urandom(SALT_LENGTH)  # ✅ random salt
+
+    key = _kdf(salt, params).derive(password.encode())
+
+    return f"{HASH_PREFIX}{params.encode()}${_b64encode(salt)}${_b64encode(key)}"
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against a current or legacy hash."""
+
     try:
-        kdf.verify(plain_password.encode(), stored_key)
+        params, salt, stored_key = _parse_hash(hashed_password)
+        _kdf(salt, params).verify(plain_password.encode(), stored_key)
         return True
     except Exception:
-        return False
\ No newline at end of file
+        return False
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    True when the stored hash is weaker than the active cost.
+
+    Never downgrades: a hash made at a higher cost (e.g. before a slower
+    host calibrated lower) is kept. Legacy-format hashes are upgraded
+    unless that would lower their cost.
+    """
+
+    try:
+        params, _, _ = _parse_hash(hashed_password)
+    except Exception:
+        return False
+
+    active = get_scrypt_params()
+    if not hashed_password.startswith(HASH_PREFIX):
+        return not active.weaker_than(params)
+    return params.weaker_than(active)
+
+
+# Hash of a random secret per cost, filled on the password pool (startup
+# warm-up, or the first unknown-username login at a new cost). Verifying
+# against it costs the same as a real password, so unknown usernames take
+# as long to reject as wrong passwords.
+_dummy_hashes: dict[ScryptParams, str] = {}
+
+
+# ============================================================
+# COST CALIBRATION
+# ============================================================
+
+def calibrate_scrypt_params(
+    target_ms: float,
+    r: int = 8,
+    p: int = 1,
+    min_log_n: int | None = None,
+    max_log_n: int = 18,
+) -> ScryptParams:
+    """
+    Pick the highest N whose derivation fits the latency budget on this host.
+
+    Each candidate is timed twice and the faster run counts, to discount
+    one-off scheduling noise. `min_log_n` is returned even if it is over
+    budget, so the cost never drops below a safe floor; it defaults to the
+    configured cost or the legacy one (ln=14), whichever is higher.
+    """
+
+    if min_log_n is None:
+        min_log_n = max(settings.PASSWORD_SCRYPT_LOG_N, LEGACY_PARAMS.log_n)
+    max_log_n = max(max_log_n, min_log_n)
+
+    best = ScryptParams(log_n=min_log_n, r=r, p=p)
+    salt = os.urandom(SALT_LENGTH)
+
+    for log_n in range(min_log_n, max_log_n + 1):
+        candidate = ScryptParams(log_n=log_n, r=r, p=p)
+        elapsed_ms = min(_time_derive(salt, candidate) for _ in range(2))
+        if elapsed_ms > target_ms:
+            break
+        best = candidate
+
+    return best
+
+
+def _time_derive(salt: bytes, params: ScryptParams) -> float:
+    started = time.perf_counter()
+    _kdf(salt, params).derive(b"calibration")
+    return (time.perf_counter() - started) * 1000
+
+
+# ============================================================
+# ASYNC (POOL) VARIANTS
+# ============================================================
+
+async def _run_on_pool(fn, *args):
+    try:
+        return await password_executor.run(fn, *args)
+    except ExecutorSaturatedError:
+        raise AppException(
+            ErrorType.SYS_503_SERVICE_UNAVAILABLE,
+            MessageCode.SERVICE_UNAVAILABLE,
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash on the password pool; 503 when the pool is saturated."""
+
+    # Params are passed explicitly so process-pool workers use the active cost
+    return await _run_on_pool(hash_password, password, get_scrypt_params())
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify on the password pool; 503 when the pool is saturated."""
+
+    return await _run_on_pool(verify_password, plain_password, hashed_password)
+
+
+async def warm_dummy_password_hash() -> str:
+    """Precompute the dummy hash for the active cost on the password pool."""
+
+    params = get_scrypt_params()
+    if params not in _dummy_hashes:
+        _dummy_hashes[params] = await _run_on_pool(
+            hash_password, secrets.token_urlsafe(32), params
+        )
+    return _dummy_hashes[params]
+
+
+async def dummy_verify_async(plain_password: str) -> bool:
+    """Spend one verification's worth of work for a non-existent account."""
+
+    await _run_on_pool(
+        verify_password, plain_password, await warm_dummy_password_hash()
+    )
+    return False
+
+
+def hash_passwords(passwords: list[str], params: ScryptParams) -> list[str]:
+    return [hash_password(password, params) for password in passwords]
+
+
+async def hash_passwords_bulk(passwords: list[str], chunk_size: int = 50) -> list[str]:
+    """Hash many passwords on the bulk pool, in chunks to amortise dispatch."""
+
+    params = get_scrypt_params()
+    chunks = [
+        passwords[start:start + chunk_size]
+        for start in range(0, len(passwords), chunk_size)
+    ]
+    results = await asyncio.gather(
+        *(bulk_password_executor.run(hash_passwords, chunk, params) for chunk in chunks)
+    )
+    return [hashed for chunk in results for hashed in chunk]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Calibrate the scrypt cost")
+    parser.add_argument("command", choices=["calibrate"])
+    parser.add_argument("--target-ms", type=float, default=settings.PASSWORD_HASH_TARGET_MS)
+    parser.add_argument("--r", type=int, default=settings.PASSWORD_SCRYPT_R)
+    parser.add_argument("--p", type=int, default=settings.PASSWORD_SCRYPT_P)
+    args = parser.parse_args()
+
+    chosen = calibrate_scrypt_params(args.target_ms, r=args.r, p=args.p)
+    print(f"PASSWORD_SCRYPT_LOG_N={chosen.log_n}")
+    print(f"PASSWORD_SCRYPT_R={chosen.r}")
+    print(f"PASSWORD_SCRYPT_P={chosen.p}")
@@ -0,0 +1,129 @@
+"""
+Concurrent admin-profile lookups: blocking pymysql session versus AsyncSession.
+
+"sync" reproduces the old layer (a pymysql `Session` called from coroutines,
+blocking the loop for every round trip); "async" uses the aiomysql
+`get_ctx_mysql_db` path the API now runs. While each flood runs, `GET /health`
+is probed through the ASGI app to show how much the loop is held up. Needs a
+real MySQL (MYSQL_* settings); creates the admin table and one bench admin
+if missing.
+
+    python -m benchmarks.bench_admin_profile [--seconds 5] [--concurrency 64]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.database.mysql.base import MysqlBase
+from app.database.mysql.session import (
+    SQLALCHEMY_DATABASE_URL,
+    dispose_engine,
+    get_ctx_mysql_db,
+    get_engine,
+)
+from app.main import app
+from app.models.mysql.admin import AdminBaseModel, TblAdmin
+
+BENCH_USERNAME = "bench-admin"
+
+
+def _percentile(samples: list[float], pct: int) -> float:
+    if len(samples) < 2:
+        return max(samples, default=0.0)
+    return statistics.quantiles(samples, n=100)[pct - 1]
+
+
+async def _seed() -> int:
+    async with get_engine().begin() as conn:
+        await conn.run_sync(MysqlBase.metadata.create_all)
+
+    async with get_ctx_mysql_db() as db:
+        admin = await TblAdmin.get_by_username(db, BENCH_USERNAME)
+        if admin is None:
+            admin = await TblAdmin.create(
+                db,
+                AdminBaseModel(
+                    username=BENCH_USERNAME,
+                    email="bench@example.com",
+                    role="admin",
+                    hashed_password="-",
+                ),
+            )
+            await db.commit()
+        return admin.id
+
+
+def _sync_lookup_factory():
+    engine = create_engine(SQLALCHEMY_DATABASE_URL.replace("+aiomysql", "+pymysql"))
+    session_local = sessionmaker(bind=engine)
+
+    async def lookup(admin_id: int):
+        # The pre-async layer: sync I/O inside a coroutine
+        with session_local() as db:
+            admin = db.execute(
+                select(TblAdmin).where(TblAdmin.id == admin_id)
+            ).scalar_one_or_none()
+            return AdminBaseModel.model_validate(admin)
+
+    return lookup, engine.dispose
+
+
+async def _async_lookup(admin_id: int):
+    async with get_ctx_mysql_db() as db:
+        return AdminBaseModel.model_validate(await TblAdmin.get_by_id(db, admin_id))
+
+
+async def _run(name: str, lookup, admin_id: int, seconds: float, concurrency: int):
+    deadline = time.perf_counter() + seconds
+    completed = 0
+
+    async def flood():
+        nonlocal completed
+        while time.perf_counter() < deadline:
+            await lookup(admin_id)
+            completed += 1
+
+    async def probe(client: AsyncClient, samples: list[float]):
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await client.get("/health")
+            samples.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(0.005)
+
+    samples: list[float] = []
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        await asyncio.gather(probe(client, samples), *(flood() for _ in range(concurrency)))
+
+    return {
+        "mode": name,
+        "profiles_per_s": round(completed / seconds),
+        "health_p50_ms": round(statistics.median(samples), 2),
+        "health_p99_ms": round(_percentile(samples, 99), 2),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    admin_id = await _seed()
+
+    sync_lookup, dispose = _sync_lookup_factory()
+    print(await _run("sync", sync_lookup, admin_id, args.seconds, args.concurrency))
+    dispose()
+
+    print(await _run("async", _async_lookup, admin_id, args.seconds, args.concurrency))
+    await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+"""
+Cold `import app.main` time, and which database drivers it drags in.
+
+Each run is a fresh interpreter, so nothing is cached in `sys.modules`.
+Engines are created by the lifespan (or on first use), so importing the app
+should load no MySQL driver and open no connections; run it before and after
+touching module-level setup to see what the import costs. No database needed.
+
+    python -m benchmarks.bench_import_time [--runs 10]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+DRIVERS = ("aiomysql", "pymysql", "asyncpg", "motor", "redis")
+
+PROBE = f"""
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed_ms = (time.perf_counter() - started) * 1000
+print(json.dumps({{
+    "ms": elapsed_ms,
+    "drivers": [name for name in {DRIVERS!r} if name in sys.modules],
+}}))
+"""
+
+
+def _probe() -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE], capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    results = [_probe() for _ in range(args.runs)]
+    timings = [result["ms"] for result in results]
+
+    print({
+        "runs": args.runs,
+        "import_p50_ms": round(statistics.median(timings), 1),
+        "import_min_ms": round(min(timings), 1),
+        "drivers_loaded": results[-1]["drivers"],
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Latency of an unrelated endpoint while the worker is flooded with logins.
+
+Runs the real `JWTService` signing path (no Redis involved) for each
+`JWT_CRYPTO_EXECUTOR` mode and, concurrently, probes `GET /health` through
+the ASGI app. Reports probe p50/p99 and signing throughput.
+
+    python -m benchmarks.bench_jwt_executor [--seconds 5] [--concurrency 64]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+os.environ.setdefault(
+    "APP_JWT_PRIVATE_KEY",
+    _key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode(),
+)
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.depends.jwt_depends import JWTService  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def _percentile(samples: list[float], pct: int) -> float:
+    if len(samples) < 2:
+        return max(samples, default=0.0)
+    return statistics.quantiles(samples, n=100)[pct - 1]
+
+
+async def _run(mode: str, seconds: float, concurrency: int) -> dict:
+    settings.JWT_CRYPTO_EXECUTOR = mode
+    service = JWTService()
+    deadline = time.perf_counter() + seconds
+    signed = 0
+
+    async def login_flood():
+        nonlocal signed
+        while time.perf_counter() < deadline:
+            payload = service._generate_payload(1, "1", 15, "access")
+            await service._encode(payload)
+            signed += 1
+
+    async def probe(client: AsyncClient, samples: list[float]):
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await client.get("/health")
+            samples.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(0.005)
+
+    samples: list[float] = []
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        await asyncio.gather(
+            probe(client, samples), *(login_flood() for _ in range(concurrency))
+        )
+    service.crypto.shutdown()
+
+    return {
+        "mode": mode,
+        "signed_per_s": round(signed / seconds),
+        "health_p50_ms": round(statistics.median(samples), 2),
+        "health_p99_ms": round(_percentile(samples, 99), 2),
+        "queue_wait_max_ms": service.crypto.stats()["queue_wait_max_ms"],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    for mode in ("inline", "thread", "process"):
+        print(await _run(mode, args.seconds, args.concurrency))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
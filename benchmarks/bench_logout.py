@@ -0,0 +1,97 @@
+"""
+Logout cost versus total Redis key count.
+
+Fills the configured Redis DB with unrelated filler keys, gives one user a
+fixed number of sessions, and times `revoke_session` (single logout) and
+`revoke_user` (logout-all). With the per-user session index both should
+stay flat as the filler grows. Needs a real Redis (REDIS_* settings) and
+flushes the selected DB, so point it at a scratch instance.
+
+    python -m benchmarks.bench_logout [--sessions 20] [--rounds 50]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+os.environ.setdefault("APP_JWT_ALGORITHM", "EdDSA")
+os.environ.setdefault(
+    "APP_JWT_PRIVATE_KEY",
+    ed25519.Ed25519PrivateKey.generate()
+    .private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    .decode(),
+)
+
+from app.database.redis import close_redis, init_redis  # noqa: E402
+from app.depends.jwt_depends import jwt_service  # noqa: E402
+
+FILLER_SIZES = (0, 100_000, 1_000_000)
+USER_ID = 424242
+
+
+async def _fill(count: int) -> None:
+    current = await jwt_service.redis.dbsize()
+    batch = 10_000
+    for start in range(current, count, batch):
+        async with jwt_service.redis.pipeline(transaction=False) as pipe:
+            for i in range(start, min(start + batch, count)):
+                pipe.set(f"access:filler{i}", "x", ex=3600)
+            await pipe.execute()
+
+
+async def _time(coro_factory, rounds: int, sessions: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        pairs = [await jwt_service.issue_token_pair(USER_ID, "1") for _ in range(sessions)]
+        session_id = jwt_service.keyring.decode(
+            pairs[0][0], jwt_service.issuer, jwt_service.audience
+        )["sid"]
+
+        started = time.perf_counter()
+        await coro_factory(session_id)
+        samples.append((time.perf_counter() - started) * 1000)
+
+        await jwt_service.revoke_user("user", USER_ID)
+    return statistics.median(samples)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    await init_redis()
+    await jwt_service.redis.flushdb()
+    for size in FILLER_SIZES:
+        await _fill(size)
+        single = await _time(
+            lambda sid: jwt_service.revoke_session("user", USER_ID, sid),
+            args.rounds,
+            args.sessions,
+        )
+        everything = await _time(
+            lambda sid: jwt_service.revoke_user("user", USER_ID), args.rounds, args.sessions
+        )
+        print(
+            {
+                "redis_keys": await jwt_service.redis.dbsize(),
+                "logout_ms_p50": round(single, 3),
+                "logout_all_ms_p50": round(everything, 3),
+            }
+        )
+    await jwt_service.redis.flushdb()
+    await close_redis()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
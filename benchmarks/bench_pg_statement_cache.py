@@ -0,0 +1,117 @@
+"""
+`TblUser.get_by_id` throughput under different statement-reuse settings.
+
+Each variant gets its own engine built with `statement_cache_options` (the
+same helper `init_engine` uses) and runs a fixed number of concurrent
+lookups for a user seeded on first run. Point `POSTGRES_*` at a direct
+Postgres to compare cache sizes, or at PgBouncer to check the pgbouncer
+modes. Needs a real database.
+
+    python -m benchmarks.bench_pg_statement_cache [--seconds 5] [--concurrency 16]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.database.postgresql.base import PostgresBase
+from app.database.postgresql.session import get_database_url, statement_cache_options
+from app.models.postgresql.users import TblUser, UsersBaseModel
+
+BENCH_USERNAME = "bench-user"
+
+# name -> (prepared statement cache, compiled query cache, pgbouncer mode)
+VARIANTS = {
+    "no-caches": (0, 0, "off"),
+    "sqlalchemy-defaults": (100, 500, "off"),
+    "configured": (
+        settings.POSTGRES_STATEMENT_CACHE_SIZE,
+        settings.POSTGRES_QUERY_CACHE_SIZE,
+        "off",
+    ),
+    "pgbouncer-transaction": (
+        settings.POSTGRES_STATEMENT_CACHE_SIZE,
+        settings.POSTGRES_QUERY_CACHE_SIZE,
+        "transaction",
+    ),
+    "pgbouncer-legacy": (0, settings.POSTGRES_QUERY_CACHE_SIZE, "legacy"),
+}
+
+
+def _percentile(samples: list[float], pct: int) -> float:
+    if len(samples) < 2:
+        return max(samples, default=0.0)
+    return statistics.quantiles(samples, n=100)[pct - 1]
+
+
+async def _seed(session_maker) -> int:
+    async with session_maker() as db:
+        user = await TblUser.get_by_username(db, BENCH_USERNAME)
+        if user is None:
+            user = await TblUser.create(
+                db,
+                UsersBaseModel(
+                    username=BENCH_USERNAME,
+                    email="bench-user@example.com",
+                    hashed_password="-",
+                    role="1",
+                ),
+            )
+            await db.commit()
+        return user.id
+
+
+async def _run(name: str, options: tuple, user_id: int, seconds: float, concurrency: int):
+    statement_cache, query_cache, pgbouncer_mode = options
+    engine = create_async_engine(
+        get_database_url(),
+        pool_size=concurrency,
+        **statement_cache_options(statement_cache, query_cache, pgbouncer_mode),
+    )
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    deadline = time.perf_counter() + seconds
+    samples: list[float] = []
+
+    async def worker():
+        async with session_maker() as db:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                await TblUser.get_by_id(db, user_id)
+                samples.append((time.perf_counter() - started) * 1000)
+                db.expunge_all()
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    await engine.dispose()
+
+    return {
+        "variant": name,
+        "lookups_per_s": round(len(samples) / seconds),
+        "p50_ms": round(statistics.median(samples), 3),
+        "p99_ms": round(_percentile(samples, 99), 3),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--variant", choices=list(VARIANTS), action="append")
+    args = parser.parse_args()
+
+    engine = create_async_engine(get_database_url())
+    async with engine.begin() as conn:
+        await conn.run_sync(PostgresBase.metadata.create_all)
+    user_id = await _seed(async_sessionmaker(engine, expire_on_commit=False))
+    await engine.dispose()
+
+    for name in args.variant or VARIANTS:
+        print(await _run(name, VARIANTS[name], user_id, args.seconds, args.concurrency))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from app.api.admin import service
+from app.api.admin.service import AdminService, iter_lines, iter_records
+from app.core.middleware.exception_middleware import AppException
+from app.models.postgresql.users import UsersBaseModel
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+async def test_lines_split_across_chunks():
+    lines = await _collect(iter_lines(_chunks(b"\xef\xbb\xbfa,b\r\n1,", b"2\n3,4")))
+
+    assert lines == [(1, "a,b"), (2, "1,2"), (3, "3,4")]
+
+
+async def test_invalid_utf8_is_rejected():
+    with pytest.raises(AppException):
+        await _collect(iter_lines(_chunks(b"username\n\xff\n")))
+
+
+async def test_csv_and_ndjson_records():
+    csv_rows = await _collect(iter_records(
+        iter_lines(_chunks(b"username,email,password\nann,a@x.io,pw\n\nbob,,pw\nx\n")),
+        "csv",
+    ))
+    assert csv_rows == [
+        (2, {"username": "ann", "email": "a@x.io", "password": "pw"}, None),
+        (4, {"username": "bob", "password": "pw"}, None),
+        (5, None, "expected 3 columns, got 1"),
+    ]
+
+    ndjson_rows = await _collect(iter_records(
+        iter_lines(_chunks(b'{"username": "ann"}\n[1]\nnope\n')), "ndjson"
+    ))
+    assert [(line, error) for line, _, error in ndjson_rows] == [
+        (1, None), (2, "expected a JSON object"), (3, "invalid JSON"),
+    ]
+
+
+class _Model:
+    existing = {"taken"}
+    batches: list[list[str]] = []
+
+    @classmethod
+    async def bulk_create(cls, db, users):
+        cls.batches.append([user.username for user in users])
+        return {
+            user.username: index
+            for index, user in enumerate(users)
+            if user.username not in cls.existing
+        }
+
+
+class _Session:
+    commits = 0
+
+    async def commit(self):
+        self.commits += 1
+
+
+async def test_import_reports_duplicates_and_invalid_rows(monkeypatch):
+    async def fake_hash(passwords):
+        return [f"hash:{password}" for password in passwords]
+
+    monkeypatch.setattr(service, "hash_passwords_bulk", fake_hash)
+    monkeypatch.setattr(service.settings, "IMPORT_BATCH_SIZE", 2)
+    _Model.batches = []
+
+    body = "\n".join(json.dumps(row) for row in [
+        {"username": "ann", "email": "ann@example.com", "password": "pw"},
+        {"username": "ann", "email": "ann2@example.com", "password": "pw"},
+        {"username": "taken", "email": "t@example.com", "password": "pw"},
+        {"username": "cy", "email": "not-an-email", "password": "pw"},
+        {"username": "dee", "email": "dee@example.com", "password": "pw"},
+    ]).encode()
+
+    db = _Session()
+    response = await AdminService._import(
+        "user", _Model, UsersBaseModel, "1", _chunks(body), "ndjson", db, "en"
+    )
+    summary = json.loads(response.body)["data"]
+
+    assert response.status_code == 201
+    assert _Model.batches == [["ann"], ["taken", "dee"]]
+    assert db.commits == 2
+    assert (summary["received"], summary["created"]) == (5, 2)
+    assert (summary["duplicates"], summary["invalid"]) == (2, 1)
+    assert [(issue["line"], issue["username"]) for issue in summary["issues"]] == [
+        (2, "ann"), (4, "cy"), (3, "taken"),
+    ]
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from app.api.admin.service import AdminService, decode_cursor, encode_cursor
+from app.core.middleware.exception_middleware import AppException
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    assert decode_cursor(encode_cursor(42)) == 42
+    assert decode_cursor(None) is None
+
+    for bad in ("not-base64!", encode_cursor(1)[:-2], "eyJhZnRlciI6IngifQ"):
+        with pytest.raises(AppException):
+            decode_cursor(bad)
+
+
+class _Model:
+    rows = [
+        {"id": n, "username": f"u{n}", "email": f"u{n}@x.io", "role": "1", "is_active": True}
+        for n in range(1, 6)
+    ]
+
+    @classmethod
+    async def list_page(cls, db, after_id, limit, role, is_active):
+        return [row for row in cls.rows if row["id"] > (after_id or 0)][:limit]
+
+
+async def _page(cursor=None):
+    response = await AdminService._list(_Model, None, cursor, 2, None, None, "en")
+    return json.loads(response.body)["data"]
+
+
+async def test_pages_follow_next_cursor_until_exhausted():
+    seen, cursor = [], None
+    while True:
+        page = await _page(cursor)
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [1, 2, 3, 4, 5]
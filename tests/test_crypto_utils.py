@@ -0,0 +1,70 @@
+import base64
+import os
+
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+from app.config import settings
+from app.utils import crypto_utils
+from app.utils.crypto_utils import (
+    ScryptParams,
+    calibrate_scrypt_params,
+    dummy_verify_async,
+    hash_password,
+    needs_rehash,
+    verify_password,
+    warm_dummy_password_hash,
+)
+
+
+def _legacy_hash(password: str) -> str:
+    salt = os.urandom(16)
+    key = Scrypt(salt=salt, length=32, n=2**14, r=8, p=1).derive(password.encode())
+    return base64.b64encode(salt + key).decode()
+
+
+def test_hash_embeds_parameters_and_verifies():
+    hashed = hash_password("s3cret", ScryptParams(log_n=10, r=8, p=1))
+
+    assert hashed.startswith("$scrypt$v=1$ln=10,r=8,p=1$")
+    assert verify_password("s3cret", hashed)
+    assert not verify_password("wrong", hashed)
+
+
+def test_legacy_hashes_verify_and_need_rehash():
+    legacy = _legacy_hash("s3cret")
+
+    assert verify_password("s3cret", legacy)
+    assert needs_rehash(legacy)
+    assert not needs_rehash(hash_password("s3cret"))
+    assert needs_rehash(hash_password("s3cret", ScryptParams(log_n=10, r=8, p=1)))
+
+
+def test_stronger_hashes_are_never_downgraded(monkeypatch):
+    monkeypatch.setattr(crypto_utils, "_active_params", ScryptParams(log_n=12, r=8, p=1))
+
+    assert not needs_rehash(hash_password("s3cret", ScryptParams(log_n=13, r=8, p=1)))
+    assert not needs_rehash(_legacy_hash("s3cret"))  # legacy is ln=14
+    assert needs_rehash(hash_password("s3cret", ScryptParams(log_n=12, r=4, p=1)))
+
+
+def test_calibration_never_goes_below_floor():
+    params = calibrate_scrypt_params(target_ms=0, min_log_n=10, max_log_n=12)
+
+    assert params == ScryptParams(log_n=10, r=8, p=1)
+
+
+def test_calibration_floor_defaults_to_configured_cost():
+    params = calibrate_scrypt_params(target_ms=0)
+
+    assert params.log_n == max(settings.PASSWORD_SCRYPT_LOG_N, 14)
+
+
+async def test_dummy_hash_is_precomputed_once_per_cost(monkeypatch):
+    monkeypatch.setattr(crypto_utils, "_dummy_hashes", {})
+    monkeypatch.setattr(crypto_utils, "_active_params", ScryptParams(log_n=10, r=8, p=1))
+
+    warmed = await warm_dummy_password_hash()
+
+    assert "$ln=10,r=8,p=1$" in warmed
+    assert not await dummy_verify_async("anything")
+    assert crypto_utils._dummy_hashes == {ScryptParams(log_n=10, r=8, p=1): warmed}
@@ -0,0 +1,60 @@
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from app.core.security.keys import KeyRing
+
+
+def _private_pem(key) -> str:
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def _public_pem(key) -> str:
+    return key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+
+
+def test_rotated_keys_are_resolved_by_kid():
+    old_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    new_key = ed25519.Ed25519PrivateKey.generate()
+
+    old_ring = KeyRing(_private_pem(old_key), key_id="2025-01")
+    token = jwt.encode({"sub": "1"}, old_ring.signing_key, "RS256", old_ring.headers)
+
+    ring = KeyRing(
+        _private_pem(new_key),
+        algorithm="EdDSA",
+        key_id="2026-01",
+        verification_keys={"2025-01": _public_pem(old_key)},
+    )
+    key = ring.get(jwt.get_unverified_header(token)["kid"])
+
+    assert key.algorithm == "RS256"
+    assert jwt.decode(token, key.key, algorithms=[key.algorithm])["sub"] == "1"
+    assert ring.get(None).algorithm == "EdDSA"
+    assert [k["kid"] for k in ring.jwks["keys"]] == ["2026-01", "2025-01"]
+
+
+def test_default_kid_is_thumbprint_and_algorithm_must_match_key():
+    key = ec.generate_private_key(ec.SECP256R1())
+    ring = KeyRing(_private_pem(key), algorithm="ES256")
+
+    (jwk,) = ring.jwks["keys"]
+    assert jwk["kid"] == ring.signing_kid
+    assert jwk["alg"] == "ES256"
+
+    with pytest.raises(ValueError):
+        KeyRing(_private_pem(key), algorithm="RS256")
+
+
+def test_empty_keyring_publishes_no_keys():
+    ring = KeyRing("")
+
+    assert ring.jwks_json == b'{"keys":[]}'
+    assert ring.get(None) is None
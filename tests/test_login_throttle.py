@@ -0,0 +1,45 @@
+import ipaddress
+
+from fastapi import Request
+
+from app.core.security.login_throttle import LoginThrottle
+
+
+class _UnavailableRedis:
+    def register_script(self, script):
+        raise ConnectionError("redis down")
+
+
+async def test_memory_fallback_enforces_username_window(monkeypatch):
+    throttle = LoginThrottle()
+    throttle.max_per_username = 2
+    monkeypatch.setattr(throttle, "_redis", lambda: _UnavailableRedis())
+
+    assert await throttle.hit("user", "Alice", "10.0.0.1") == 0
+    assert await throttle.hit("user", "alice", "10.0.0.2") == 0
+    retry_after = await throttle.hit("user", "ALICE", "10.0.0.3")
+
+    assert 0 < retry_after <= throttle.window_ms / 1000
+    assert await throttle.hit("user", "bob", "10.0.0.3") == 0
+    assert throttle.stats()["rejected"] == 1
+    assert throttle.stats()["fallbacks"] == 4
+
+
+def _request(peer: str, *forwarded: str) -> Request:
+    return Request({
+        "type": "http",
+        "client": (peer, 443),
+        "headers": [(b"x-forwarded-for", value.encode()) for value in forwarded],
+    })
+
+
+def test_client_ip_only_trusts_forwarded_for_from_known_proxies():
+    throttle = LoginThrottle()
+    throttle.trusted_proxies = [ipaddress.ip_network("10.0.0.0/8")]
+
+    # Direct client: a forged header is ignored
+    assert throttle.client_ip(_request("203.0.113.9", "1.2.3.4")) == "203.0.113.9"
+    # Behind the load balancer: the hop it saw, not what the client claimed
+    assert throttle.client_ip(_request("10.0.0.2", "1.2.3.4, 198.51.100.7")) == "198.51.100.7"
+    assert throttle.client_ip(_request("10.0.0.2", "198.51.100.7", "10.0.0.5")) == "198.51.100.7"
+    assert throttle.client_ip(_request("10.0.0.2")) == "10.0.0.2"
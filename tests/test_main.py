@@ -20,3 +20,10 @@ async def test_health_check(async_client: AsyncClient):
     data = response.json()
     assert data["status"] == "ok"
     assert "environment" in data
+
+
+def test_import_does_not_create_mysql_engine():
+    # Created by the lifespan or on first use, never at import time
+    from app.database.mysql import session
+
+    assert session._engine is None
@@ -0,0 +1,22 @@
+import pytest
+
+from app.database.postgresql.session import statement_cache_options
+
+
+def test_pgbouncer_modes_control_statement_reuse():
+    direct = statement_cache_options(500, 1200, "off")
+    assert direct == {
+        "query_cache_size": 1200,
+        "connect_args": {"prepared_statement_cache_size": 500},
+    }
+
+    pooled = statement_cache_options(500, 1200, "transaction")["connect_args"]
+    assert pooled["prepared_statement_cache_size"] == 500
+    names = {pooled["prepared_statement_name_func"]() for _ in range(3)}
+    assert len(names) == 3
+
+    legacy = statement_cache_options(500, 1200, "legacy")["connect_args"]
+    assert legacy["prepared_statement_cache_size"] == 0
+
+    with pytest.raises(ValueError):
+        statement_cache_options(500, 1200, "session")
@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from app.database.pool import InstrumentedQueuePool
+
+
+class _Connection:
+    def close(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+async def test_checkout_metrics_track_overflow_and_timeouts():
+    pool = InstrumentedQueuePool(
+        lambda: _Connection(), pool_size=1, max_overflow=1, timeout=0.05
+    )
+
+    first, second = pool.connect(), pool.connect()
+    assert pool.metrics.checkouts == 2
+    assert pool.metrics.overflow_max == 1
+
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+    assert pool.metrics.timeouts == 1
+    assert pool.metrics.wait_ms_max >= 50
+
+    first.close()
+    second.close()
+    assert pool.recreate().metrics is pool.metrics
@@ -0,0 +1,22 @@
+import pytest
+
+from app.database.redis import client
+
+
+async def test_lifecycle_survives_unreachable_server(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        client.CONFIG_SETTINGS, "REDIS_UNIX_SOCKET", str(tmp_path / "missing.sock")
+    )
+    monkeypatch.setattr(client.CONFIG_SETTINGS, "REDIS_POOL_WARMUP", 3)
+
+    redis = await client.init_redis()
+    try:
+        assert client.get_redis() is redis
+        # Failed warm-up connections must go back to the pool
+        assert client.redis_pool_stats()["in_use"] == 0
+        assert (await client.redis_health())["status"] == "unavailable"
+    finally:
+        await client.close_redis()
+
+    with pytest.raises(RuntimeError):
+        client.get_redis()
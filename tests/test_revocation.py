@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+from app.core.security import revocation
+from app.core.security.revocation import RevocationListener
+
+
+class _Stream:
+    """Serves seeded entries in XREAD batches, recording freshness per call."""
+
+    def __init__(self, listener: RevocationListener, total: int):
+        exp = int(time.time()) + 3600
+        self.entries = [
+            (f"{n}-0", {"sessions": f"access:jti{n}@{exp}"}) for n in range(1, total + 1)
+        ]
+        self.listener = listener
+        self.fresh_at_call: list[bool] = []
+        self.drained = asyncio.Event()
+
+    async def xread(self, streams, count, block):
+        self.fresh_at_call.append(self.listener.is_fresh())
+        (last_id,) = streams.values()
+        after = int(last_id.split("-")[0])
+        batch = [entry for entry in self.entries if int(entry[0].split("-")[0]) > after]
+        if not batch:
+            self.drained.set()
+            await asyncio.sleep(block / 1000)
+        return [("revocations", batch[:count])] if batch else []
+
+
+async def test_not_fresh_until_replay_has_caught_up(monkeypatch):
+    listener = RevocationListener("revocations", 3600, max_lag_seconds=5)
+    stream = _Stream(listener, 1200)
+    monkeypatch.setattr(revocation, "get_redis", lambda: stream)
+    listener._last_id = "0-0"
+
+    listener.start()
+    try:
+        await asyncio.wait_for(stream.drained.wait(), 1)
+    finally:
+        await listener.stop()
+
+    # Batches of 500, 500, 200: fresh only once the short batch is applied
+    assert stream.fresh_at_call[:4] == [False, False, False, True]
+    assert listener.is_revoked("jti1200")
+    assert listener.is_fresh()
+
+
+def test_purge_drops_only_expired_entries():
+    listener = RevocationListener("revocations", 3600, max_lag_seconds=5)
+    now = int(time.time())
+    listener.deny(f"access:old@{now - 1},access:live@{now + 60}")
+    # Re-denied with a later expiry: the stale heap entry must not evict it
+    listener.deny(f"refresh:moved@{now - 1}")
+    listener.deny(f"refresh:moved@{now + 60}")
+
+    listener.purge_expired()
+
+    assert not listener.is_revoked("old")
+    assert listener.is_revoked("live")
+    assert listener.is_revoked("moved")
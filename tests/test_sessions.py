@@ -0,0 +1,130 @@
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from app.api.auth.service import AuthService
+from app.core.middleware.exception_middleware import AppException
+from app.core.security.keys import KeyRing
+from app.database.redis import client as redis_client
+from app.depends.jwt_depends import ClaimsPrincipal, jwt_service
+
+# The revoke paths are Lua scripts: fakeredis runs them through lupa
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch):
+    pem = ed25519.Ed25519PrivateKey.generate().private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    keyring = KeyRing(private_key_pem=pem, algorithm="EdDSA")
+    monkeypatch.setattr(jwt_service, "keyring", keyring)
+    monkeypatch.setattr(jwt_service, "_sign", keyring.encode)
+    monkeypatch.setattr(jwt_service, "_verify", keyring.decode)
+
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_client, "_client", redis)
+    jwt_service.token_cache.clear()
+    yield redis
+    jwt_service.token_cache.clear()
+
+
+async def test_user_and_admin_with_same_id_have_separate_sessions():
+    user_access, _ = await jwt_service.issue_token_pair(5, "1")
+    admin_access, _ = await jwt_service.issue_token_pair(5, "admin")
+
+    assert len(await jwt_service.list_user_sessions("user", 5)) == 1
+    assert len(await jwt_service.list_user_sessions("admin", 5)) == 1
+
+    await jwt_service.revoke_user("user", 5)
+
+    assert await jwt_service.verify_token(admin_access, "access")
+    with pytest.raises(AppException):
+        await jwt_service.verify_token(user_access, "access")
+
+
+def _claims(token: str) -> dict:
+    return jwt_service.keyring.decode(token, jwt_service.issuer, jwt_service.audience)
+
+
+async def test_revoke_session_leaves_other_sessions_alive():
+    first, _ = await jwt_service.issue_token_pair(7, "1")
+    second, _ = await jwt_service.issue_token_pair(7, "1")
+    assert len(await jwt_service.list_user_sessions("user", 7)) == 2
+
+    revoked = await jwt_service.revoke_session("user", 7, _claims(first)["sid"])
+
+    assert sorted(member.partition(":")[0] for member in revoked) == ["access", "refresh"]
+    sessions = await jwt_service.list_user_sessions("user", 7)
+    assert [session["session_id"] for session in sessions] == [_claims(second)["sid"]]
+    assert await jwt_service.verify_token(second, "access")
+    with pytest.raises(AppException):
+        await jwt_service.verify_token(first, "access")
+
+
+async def test_logout_without_sid_claim_revokes_only_that_token():
+    keep, _ = await jwt_service.issue_token_pair(9, "1")
+
+    # Token from before session ids: stored under its own jti
+    legacy = jwt_service._generate_payload(9, "1", 15, "access")
+    legacy.pop("sid")
+    await jwt_service._store_sessions({**legacy, "sid": legacy["jti"]})
+    principal = ClaimsPrincipal(legacy)
+
+    await AuthService.logout(principal, "en")
+
+    assert principal.session_id == legacy["jti"]
+    assert await jwt_service.redis.get(f"access:{legacy['jti']}") is None
+    assert await jwt_service.verify_token(keep, "access")
+
+
+async def test_refresh_keeps_the_session_so_logout_revokes_old_access():
+    old_access, refresh = await jwt_service.issue_token_pair(11, "1")
+    payload = await jwt_service.verify_token(refresh, "refresh")
+
+    new_access, _ = await jwt_service.rotate_token_pair(payload)
+
+    sessions = await jwt_service.list_user_sessions("user", 11)
+    assert [session["session_id"] for session in sessions] == [payload["sid"]]
+
+    await jwt_service.revoke_session("user", 11, _claims(new_access)["sid"])
+    for token in (old_access, new_access):
+        with pytest.raises(AppException):
+            await jwt_service.verify_token(token, "access")
+
+
+async def test_cached_token_revoked_on_another_worker_is_rejected():
+    access, _ = await jwt_service.issue_token_pair(13, "1")
+    jti = _claims(access)["jti"]
+    await jwt_service.verify_token(access, "access")
+    assert jwt_service.token_cache.get_payload(access) is not None
+
+    # Another worker logged the session out: keys gone, local cache untouched
+    await jwt_service.redis.delete(f"access:{jti}")
+
+    # Listener not fresh: the cache hit is not trusted, Redis decides
+    hits = jwt_service.token_cache.hits
+    with pytest.raises(AppException):
+        await jwt_service.verify_token(access, "access")
+    assert jwt_service.token_cache.hits == hits
+    assert jwt_service.token_cache.rejected >= 1
+
+
+async def test_cache_hit_checks_fresh_deny_list(monkeypatch):
+    access, _ = await jwt_service.issue_token_pair(15, "1")
+    jti = _claims(access)["jti"]
+    monkeypatch.setattr(jwt_service.revocations, "is_fresh", lambda: True)
+    await jwt_service.verify_token(access, "access")
+
+    # Fresh listener and not revoked: served from the cache
+    await jwt_service.redis.delete(f"access:{jti}")
+    assert await jwt_service.verify_token(access, "access")
+
+    # Another worker's revocation arrives through the stream
+    jwt_service.revocations.deny(f"access:{jti}@{_claims(access)['exp']}")
+
+    with pytest.raises(AppException):
+        await jwt_service.verify_token(access, "access")
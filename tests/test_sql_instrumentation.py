@@ -0,0 +1,49 @@
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.middleware.sql_stats_middleware import SQLStatsMiddleware
+from app.database import instrumentation
+
+
+def _engine(monkeypatch, slow_ms=0.0):
+    monkeypatch.setattr(instrumentation.CONFIG_SETTINGS, "SQL_SLOW_QUERY_MS", slow_ms)
+    engine = create_engine("sqlite://")
+    instrumentation.instrument_engine(engine)
+    return engine
+
+
+def test_request_header_and_n_plus_one(monkeypatch, caplog):
+    engine = _engine(monkeypatch)
+    app = FastAPI()
+    app.add_middleware(SQLStatsMiddleware)
+
+    @app.get("/items")
+    def items():
+        with engine.connect() as conn:
+            for item_id in range(6):
+                conn.execute(text("SELECT :id"), {"id": item_id})
+        return {}
+
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        response = TestClient(app).get("/items")
+
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert 'desc="6 queries"' in response.headers["Server-Timing"]
+    assert "N+1 suspect | GET /items | 6x SELECT ?" in caplog.text
+
+
+def test_slow_statements_logged_without_values(monkeypatch, caplog):
+    engine = _engine(monkeypatch, slow_ms=0.000001)
+
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT :password"), {"password": "hunter2"})
+
+    assert "Slow sqlite statement" in caplog.text
+    assert "params=['str']" in caplog.text
+    assert "hunter2" not in caplog.text
+    # Outside a request nothing is attributed
+    assert instrumentation.current_stats() is None
@@ -0,0 +1,56 @@
+import time
+
+from app.core.cache.token_cache import VerifiedTokenCache
+from app.core.cache.ttl_cache import TTLCache
+
+
+def _payload(sub: str, jti: str, exp_in: int = 900) -> dict:
+    return {"sub": sub, "jti": jti, "type": "access", "exp": int(time.time()) + exp_in}
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    cache.get("a")
+    cache.set("c", 3, 60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_token_cache_counts_hits_and_invalidates_subject():
+    cache = VerifiedTokenCache(maxsize=10, revalidate_seconds=30)
+    cache.put_payload("token-1", _payload("7", "j1"))
+    cache.put_payload("token-2", _payload("7", "j2"))
+    cache.put_payload("token-3", _payload("8", "j3"))
+
+    assert cache.get_payload("token-1")["jti"] == "j1"
+    assert cache.get_payload("unknown") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+    assert cache.invalidate_subject(7) == 2
+    assert cache.get_payload("token-2") is None
+    assert cache.get_payload("token-3")["jti"] == "j3"
+
+
+def test_token_cache_skips_expired_tokens():
+    cache = VerifiedTokenCache(maxsize=10, revalidate_seconds=30)
+    cache.put_payload("token-1", _payload("7", "j1", exp_in=-1))
+
+    assert cache.get_payload("token-1") is None
+    assert len(cache) == 0
+
+
+def test_rejected_hits_count_as_misses():
+    cache = VerifiedTokenCache(maxsize=10, revalidate_seconds=30)
+    cache.put_payload("token-1", _payload("7", "j1"))
+
+    assert cache.get_payload("token-1") is not None
+    cache.reject()  # e.g. the revocation listener was stale
+
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (0, 1)
+    assert cache.stats()["rejected"] == 1
+    assert cache.stats()["hit_ratio"] == 0.0
@@ -0,0 +1,96 @@
+from app.core.security.username_filter import UsernameFilter
+
+
+class _BitmapRedis:
+    """Just enough of a Redis client for the filter's bitmap commands."""
+
+    def __init__(self):
+        self.bits = set()
+        self.keys = {}  # key -> seconds to live (None: no expiry)
+
+    def pipeline(self, transaction=False):
+        return _Pipeline(self)
+
+    async def exists(self, key):
+        return key in self.keys
+
+    async def ttl(self, key):
+        if key not in self.keys:
+            return -2
+        return -1 if self.keys[key] is None else self.keys[key]
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.keys:
+            return None
+        self.keys[key] = ex
+        return True
+
+    async def delete(self, key):
+        self.keys.pop(key, None)
+
+
+class _Pipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def exists(self, key):
+        self.ops.append(lambda: key in self.redis.keys)
+
+    def getbit(self, key, offset):
+        self.ops.append(lambda: int((key, offset) in self.redis.bits))
+
+    def setbit(self, key, offset, value):
+        self.ops.append(lambda: self.redis.bits.add((key, offset)))
+
+    async def execute(self):
+        ops, self.ops = self.ops, []
+        return [op() for op in ops]
+
+
+async def _names(*names):
+    for name in names:
+        yield name
+
+
+async def test_filter_rejects_unknown_only_once_ready(monkeypatch):
+    redis = _BitmapRedis()
+    username_filter = UsernameFilter()
+    username_filter.enabled = True
+    monkeypatch.setattr(username_filter, "_redis", lambda: redis)
+
+    # Not built yet: every name might exist
+    assert await username_filter.might_exist("user", "ghost")
+
+    assert await username_filter.build("user", _names("alice", "bob")) == 2
+    assert await username_filter.might_exist("user", "alice")
+    assert not await username_filter.might_exist("user", "ghost")
+    assert await username_filter.might_exist("admin", "ghost")  # realm not built
+
+    await username_filter.add("user", "ghost")
+    assert await username_filter.might_exist("user", "ghost")
+
+
+async def test_build_refreshes_marker_once_it_is_past_one_period(monkeypatch):
+    redis = _BitmapRedis()
+    username_filter = UsernameFilter()
+    username_filter.enabled = True
+    monkeypatch.setattr(username_filter, "_redis", lambda: redis)
+
+    assert await username_filter.build("user", _names("alice")) == 1
+    ready = "usernames:bloom:user:ready"
+    assert redis.keys[ready] == username_filter.rebuild_seconds * 2
+
+    # Fresh marker: periodic calls are no-ops
+    assert await username_filter.build("user", _names("alice", "bob")) == 0
+
+    # Older than one period: rebuilt while the old marker is still valid
+    redis.keys[ready] = username_filter.rebuild_seconds - 1
+    assert await username_filter.build("user", _names("alice", "bob")) == 2
+    assert redis.keys[ready] == username_filter.rebuild_seconds * 2
@@ -0,0 +1,26 @@
+from app.database.warmup import Readiness
+
+
+async def test_ready_only_after_failed_store_recovers():
+    attempts = {"flaky": 0}
+
+    async def healthy(count):
+        return count
+
+    async def flaky(count):
+        attempts["flaky"] += 1
+        if attempts["flaky"] == 1:
+            raise ConnectionRefusedError
+        return count
+
+    readiness = Readiness()
+    readiness.targets = {"healthy": (healthy, 2), "flaky": (flaky, 3)}
+    readiness.retry_backoff = 0
+
+    await readiness.warm_up()
+    assert not readiness.ready
+    assert readiness.results["flaky"]["status"] == "unavailable"
+
+    await readiness._task
+    assert readiness.ready
+    assert readiness.results["flaky"]["connections"] == 3